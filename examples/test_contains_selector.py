@@ -7,3 +7,13 @@ class ContainsSelectorTests(BaseCase):
         self.assert_element('div.box div:contains("Math Work")')
         self.click('a:contains("Next")')
         self.assert_element('div div:contains("Drone Fishing")')
+
+    def test_contains_selector_list_click(self):
+        self.open(
+            "data:text/html,"
+            '<h1 onclick="this.id=\'clicked\'">Title</h1>'
+            '<p onclick="this.id=\'clicked\'">Hello</p>'
+        )
+        self.js_click_all("h1, p:contains(Hello)")
+        self.assert_element("h1#clicked")  # Only "p" is filtered by text
+        self.assert_element("p#clicked")
@@ -0,0 +1,29 @@
+""" Run with pytest """
+from seleniumbase.fixtures.base_case import _split_contains_selector
+
+
+def test_split_contains_selector():
+    """Verify how ":contains()" selectors get split for pure-JS clicks.
+    (None means that only jQuery can apply the selector correctly.)"""
+    assert _split_contains_selector("p:contains(Hello)") == (
+        "p", "Hello", False
+    )
+    assert _split_contains_selector('a:contains("Next")') == (
+        "a", "Next", False
+    )
+    assert _split_contains_selector("div span:contains('A, B')") == (
+        "div span", "A, B", False
+    )
+    assert _split_contains_selector("li:contains(Item):first") == (
+        "li", "Item", True
+    )
+    assert _split_contains_selector("div > :contains(Hi)") == (
+        "div > *", "Hi", False
+    )
+    assert _split_contains_selector(":contains(Hi)") == ("*", "Hi", False)
+    assert _split_contains_selector('[title="a,b"]:contains(Hi)') == (
+        '[title="a,b"]', "Hi", False
+    )
+    assert _split_contains_selector("h1, p:contains(Hello)") is None
+    assert _split_contains_selector("p:contains(A):contains(B)") is None
+    assert _split_contains_selector("div.box") is None
@@ -113,3 +113,32 @@ def deprecated(message=None):
         return new_func
 
     return decorated_method_to_deprecate
+
+
+def memoize(max_size=512):
+    """This decorator caches the results of a function based on its args.
+    Only use it on functions where the result depends only on the args.
+    Once the cache reaches max_size entries, it gets emptied and refilled.
+    (Unlike functools.lru_cache, this also works with Python 2.7)"""
+
+    def decorated_function_with_cache(func):
+        cache = {}
+
+        @wraps(func)
+        def memoized_function(*args):
+            try:
+                return cache[args]
+            except KeyError:
+                pass
+            except TypeError:
+                return func(*args)  # Unhashable args can't be cached
+            if len(cache) >= max_size:
+                cache.clear()
+            result = func(*args)
+            cache[args] = result
+            return result
+
+        memoized_function.cache_clear = cache.clear
+        return memoized_function
+
+    return decorated_function_with_cache
@@ -31,6 +31,7 @@ Code becomes greatly simplified and easier to maintain.
 """
 
 import codecs
+import collections
 import json
 import logging
 import os
@@ -52,6 +53,7 @@ from selenium.webdriver.remote.remote_connection import LOGGER
 from seleniumbase import config as sb_config
 from seleniumbase.common import decorators
 from seleniumbase.config import settings
+from seleniumbase.core import download_helper
 from seleniumbase.core import log_helper
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import css_to_xpath
@@ -59,6 +61,7 @@ from seleniumbase.fixtures import js_utils
 from seleniumbase.fixtures import page_actions
 from seleniumbase.fixtures import page_utils
 from seleniumbase.fixtures import shared_utils
+from seleniumbase.fixtures.words import SD
 from seleniumbase.fixtures import xpath_to_css
 
 logging.getLogger("requests").setLevel(logging.ERROR)
@@ -68,29 +71,372 @@ LOGGER.setLevel(logging.WARNING)
 if sys.version_info[0] < 3:
     reload(sys)  # noqa: F821
     sys.setdefaultencoding("utf8")
+colorama = None  # (Only used for colored console output on non-Linux)
+if "linux" not in sys.platform:
+    import colorama
+
+# Scripts that get called frequently (Reuse the same string objects)
+_JS_NOW = "return Date.now();"
+_JS_ORIGIN = "return window.location.origin;"
+_JS_CFRAME_SWAP = "return document.cframe_swap;"
+_JS_CFRAME_SWAP_AND_TAB = (
+    "return [document.cframe_swap, document.cframe_tab];"
+)
+_JS_URL_AND_RECORDED_ACTIONS = (
+    "var actions = null; "
+    "try { actions = window.sessionStorage.getItem('recorded_actions'); } "
+    "catch (e) {} "  # (sessionStorage can be blocked on "data:" URLs)
+    "return [window.location.href, actions];"
+)
+_CDP_URL_AND_RECORDED_ACTIONS = (
+    "(function() { %s })()" % _JS_URL_AND_RECORDED_ACTIONS
+)
+_JS_HAS_ANGULARJS = "return !!window.angular;"
+_JS_SHADOW_ROOT = "return arguments[0].shadowRoot;"
+_JS_STORAGE_KEYS = (
+    "var ls = window.%s, keys = []; "
+    "for (var i = 0; i < ls.length; ++i) "
+    "  keys[i] = ls.key(i); "
+    "return keys;"
+)
+_JS_STORAGE_ITEMS = (  # (Gets all items if the keys array is null)
+    "var ls = window.%s, items = {}, keys = arguments[0]; "
+    "if (!keys) { keys = []; "
+    "  for (var i = 0; i < ls.length; ++i) keys[i] = ls.key(i); } "
+    "for (var j = 0; j < keys.length; ++j) "
+    "  items[keys[j]] = ls.getItem(keys[j]); "
+    "return items;"
+)
+_JS_REMOVE_STORAGE_ITEMS = (
+    "var ls = window.%s, keys = arguments[0]; "
+    "for (var i = 0; i < keys.length; ++i) "
+    "  ls.removeItem(keys[i]);"
+)
+_JS_LOCAL_STORAGE_KEYS = _JS_STORAGE_KEYS % "localStorage"
+_JS_LOCAL_STORAGE_ITEMS = _JS_STORAGE_ITEMS % "localStorage"
+_JS_REMOVE_LOCAL_STORAGE_ITEMS = _JS_REMOVE_STORAGE_ITEMS % "localStorage"
+_JS_SESSION_STORAGE_KEYS = _JS_STORAGE_KEYS % "sessionStorage"
+_JS_SESSION_STORAGE_ITEMS = _JS_STORAGE_ITEMS % "sessionStorage"
+_JS_REMOVE_SESSION_STORAGE_ITEMS = (
+    _JS_REMOVE_STORAGE_ITEMS % "sessionStorage"
+)
+_DESIGN_MODE_ON = "document.designMode = 'on';"
+_DESIGN_MODE_OFF = "document.designMode = 'off';"
+_BRING_TO_FRONT_JS = "document.querySelector('%s').style.zIndex = '999999';"
+
+# Runs an action on the elements that match a selector (with pure JS)
+_ELEMENTS_ACTION_JS = """var $elements = document.querySelectorAll('%s');
+var length = $elements.length;
+if (%s && length > 1) { length = 1; }
+for (var index = 0; index < length; index++) {
+    var $element = $elements[index];
+    %s
+}"""
+_JS_ELEMENT_ACTIONS = {
+    "hide": "$element.style.display = 'none';",
+    "show": (  # Like jQuery: Use the default display of the element's tag
+        "$element.style.display = '';"
+        "if (window.getComputedStyle($element).display === 'none') {"
+        "var $temp = document.createElement($element.nodeName);"
+        "document.body.appendChild($temp);"
+        "var $display = window.getComputedStyle($temp).display;"
+        "document.body.removeChild($temp);"
+        "if (!$display || $display === 'none') { $display = 'block'; }"
+        "$element.style.display = $display;}"
+    ),
+    "remove": "$element.remove();",
+}
+_JQUERY_ELEMENT_ACTIONS = {
+    "hide": ("jQuery('", "').hide();"),
+    "show": ("jQuery('", "').show(0);"),
+    "remove": ("jQuery('", "').remove();"),
+}
+# The (prefix, suffix) around the selector for each (action, first_only),
+# so that building a script is just a join instead of a full % format.
+_ELEMENTS_ACTION_SCRIPTS = dict(
+    (
+        (action, first_only),
+        tuple(
+            (
+                _ELEMENTS_ACTION_JS
+                % ("{sel}", "true" if first_only else "false", js_action)
+            ).split("{sel}")
+        ),
+    )
+    for action, js_action in _JS_ELEMENT_ACTIONS.items()
+    for first_only in (True, False)
+)
+_SHOW_FILE_CHOOSERS_JS = _ELEMENTS_ACTION_JS % (
+    'input[type=\\"file\\"]',
+    "false",
+    _JS_ELEMENT_ACTIONS["show"]
+    + """var the_class = $element.getAttribute('class');
+    if (the_class) {
+    var new_class = the_class.replaceAll('hidden', 'visible');
+    $element.setAttribute('class', new_class);}""",
+)
+
+# Matches a jQuery-style "BASE:contains(TEXT)" selector (see below)
+_CONTAINS_SELECTOR_RE = re.compile(
+    r"""^(.*):contains\((["']?)(.*)\2\)(:first)?$"""
+)
+
+# Clicks the elements (or just the first) that match BASE and contain TEXT.
+# Returns false without clicking if the browser can't parse BASE.
+_CONTAINS_CLICK_JS = """var $elements;
+try { $elements = document.querySelectorAll('%s'); }
+catch(e) { return false; }
+var $text = '%s';
+for (var index = 0; index < $elements.length; index++) {
+    if ($elements[index].textContent.indexOf($text) !== -1) {
+        $elements[index].click();
+        if (%s) { break; }
+    }
+}
+return true;"""
+
+# Sets the value of the first matching element. Input sliders (range) also
+# get a "mousemove" event if requested, because some listeners need one.
+_SET_VALUE_JS = """var $elm = document.querySelector('%s');
+$elm.value = '%s';
+if (%s && $elm.getAttribute('type') === 'range') {
+    try { $elm.dispatchEvent(new Event('mousemove')); } catch(e) {}
+}"""
+
+# Sets the textContent of an element (arguments[0]), unless the element is
+# an input or textarea. Either way, returns the tag name of the element.
+_SET_TEXT_CONTENT_JS = """var $elm = arguments[0];
+var tag = $elm.tagName.toLowerCase();
+if (tag !== 'input' && tag !== 'textarea') { $elm.textContent = '%s'; }
+return tag;"""
+
+# Walks a "::shadow " selector chain in the browser. (Null if not found yet)
+_SHADOW_ELEMENT_JS = """var selectors = arguments[0];
+var element = document.querySelector(selectors[0]);
+for (var i = 1; i < selectors.length; i++) {
+    if (!element || !element.shadowRoot) { return null; }
+    element = element.shadowRoot.querySelector(selectors[i]);
+}
+return element;"""
+
+# Finds the original "box-shadow: ...;" of an element before highlighting
+_BOX_SHADOW_RE = re.compile(r"box-shadow: [^;]*;")
+
+# PDF-to-HTML conversion artifacts mapped to the intended Chinese characters
+_UNICODE_FIXES = {
+    "\u2f8f": "\u884c",
+    "\u2f45": "\u65b9",
+    "\u2f08": "\u4eba",
+    "\u2f70": "\u793a",
+    "\xe2\xbe\x8f": "\xe8\xa1\x8c",
+    "\xe2\xbd\xb0": "\xe7\xa4\xba",
+    "\xe2\xbd\x85": "\xe6\x96\xb9",
+}
+_UNICODE_FIX_RE = re.compile("|".join(map(re.escape, _UNICODE_FIXES)))
+
+# The "browserName" capabilities of Chromium-based browsers
+_CHROMIUM_BROWSERS = frozenset(("chrome", "edge", "msedge", "opera"))
+
+# The uppercase forms of the By.* values for Demo Mode messenger posts
+_BY_UPPER = dict(
+    (value, value.upper())
+    for name, value in vars(By).items()
+    if not name.startswith("_") and isinstance(value, str)
+)
+
+# Clears text that autocomplete/autofill puts back after element.clear()
+_AUTOFILL_BACKSPACES = Keys.BACK_SPACE * 42  # Is the answer to everything
+
+# Browser log entries from this library are caused by SeleniumBase itself
+_MESSENGER_LIBRARY = "//cdnjs.cloudflare.com/ajax/libs/messenger"
+
+# The Reveal-JS presentation themes (in the order that they're listed)
+_REVEAL_THEME_CSS = collections.OrderedDict(
+    (
+        ("serif", constants.Reveal.SERIF_MIN_CSS),
+        ("white", constants.Reveal.WHITE_MIN_CSS),
+        ("black", constants.Reveal.BLACK_MIN_CSS),
+        ("beige", constants.Reveal.BEIGE_MIN_CSS),
+        ("simple", constants.Reveal.SIMPLE_MIN_CSS),
+        ("sky", constants.Reveal.SKY_MIN_CSS),
+        ("league", constants.Reveal.LEAGUE_MIN_CSS),
+        ("moon", constants.Reveal.MOON_MIN_CSS),
+        ("night", constants.Reveal.NIGHT_MIN_CSS),
+        ("blood", constants.Reveal.BLOOD_MIN_CSS),
+        ("solarized", constants.Reveal.SOLARIZED_MIN_CSS),
+    )
+)
+_REVEAL_TRANSITIONS = ("none", "slide", "fade", "zoom", "convex", "concave")
+
+# The end of a saved presentation. (Needs: showNotes, autoSlide)
+_REVEAL_FOOTER = (
+    "\n</div>\n"
+    "</div>\n"
+    '<script src="%s"></script>\n'
+    '<script src="%s"></script>\n'
+    "<script>Reveal.initialize("
+    "{showNotes: %%s, slideNumber: true, progress: true, hash: false, "
+    "autoSlide: %%s,});"
+    "</script>\n"
+    "</body>\n"
+    "</html>\n"
+    % (constants.Reveal.MIN_JS, constants.PrettifyJS.RUN_PRETTIFY_JS)
+)
+
+# The HighCharts libraries that each chart imports unless libs=False.
+# (save_presentation() keeps only the first import of this exact block.)
+_CHART_LIBS = """
+            <script src="%s"></script>
+            <script src="%s"></script>
+            <script src="%s"></script>
+            <script src="%s"></script>
+            """ % (
+    constants.HighCharts.HC_JS,
+    constants.HighCharts.EXPORTING_JS,
+    constants.HighCharts.EXPORT_DATA_JS,
+    constants.HighCharts.ACCESSIBILITY_JS,
+)
+
+
+def _clean_inspector_message(message):
+    """ Formats an HTML-Inspector browser log entry for printing. """
+    if "0:6053 " in message:
+        # The text between the first and second "0:6053" markers
+        message = message.partition("0:6053")[2].partition("0:6053")[0]
+    if "\\u003C" in message:
+        message = message.replace("\\u003C", "<")
+    if message.startswith(' "') and message.count('"') == 2:
+        message = message[2:message.index('"', 2)]
+    return "X - " + message
+
+
+@decorators.memoize(max_size=1024)
+def _recalculate_selector(selector, by, xp_ok):
+    """ The string work of BaseCase.__recalculate_selector(), cached. """
+    if page_utils.is_xpath_selector(selector):
+        by = By.XPATH
+    if page_utils.is_link_text_selector(selector):
+        selector = page_utils.get_link_text_from_selector(selector)
+        by = By.LINK_TEXT
+    if page_utils.is_partial_link_text_selector(selector):
+        selector = page_utils.get_partial_link_text_from_selector(selector)
+        by = By.PARTIAL_LINK_TEXT
+    if page_utils.is_name_selector(selector):
+        name = page_utils.get_name_from_selector(selector)
+        selector = '[name="%s"]' % name
+        by = By.CSS_SELECTOR
+    if xp_ok:
+        if ":contains(" in selector and by == By.CSS_SELECTOR:
+            selector = css_to_xpath.convert_css_to_xpath(selector)
+            by = By.XPATH
+    return (selector, by)
+
+
+def _has_top_level_comma(selector):
+    """ Returns True if the CSS selector is a selector list ("a, b"). """
+    depth = 0
+    quote = None
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            return True
+    return False
+
+
+def _split_contains_selector(selector):
+    """Splits a jQuery-style "BASE:contains(TEXT)" selector into
+    (BASE, TEXT, first_only) so that it can be clicked with pure JS.
+    Returns None if only jQuery can apply the selector correctly.
+    (For example, in "h1, p:contains(TEXT)" the text only filters "p".)"""
+    match = _CONTAINS_SELECTOR_RE.match(selector)
+    if not match:
+        return None
+    base = match.group(1)
+    if ":contains(" in base or _has_top_level_comma(base):
+        return None
+    if not base or base[-1] in " >+~":
+        base += "*"  # ":contains()" applies to any element there
+    return (base, match.group(3), bool(match.group(4)))
+
+
+def _by_upper(by):
+    """ Returns the uppercase form of a By.* value for Demo Mode posts. """
+    return _BY_UPPER.get(by) or by.upper()
+
+
+def _coerce_text(text):
+    """ Numbers can be typed too, but they must be sent as strings. """
+    if isinstance(text, (int, float)):
+        return str(text)
+    return text
+
+
+# Recorder Mode doesn't run on URLs that start with these prefixes
+_RECORDER_BAD_PREFIXES = ("data:", "about:", "chrome:", "edge:")
+
+# Recorder Mode actions that map directly to SeleniumBase method calls
+_REC_ONE_ARG_METHODS = {
+    "click": "click",
+    "js_cl": "js_click",
+    "sw_fr": "switch_to_frame",
+    "s_c_f": "set_content_to_frame",
+    "as_el": "assert_element",
+    "as_ep": "assert_element_present",
+    "asenv": "assert_element_not_visible",
+    "as_lt": "assert_link_text",
+    "as_ti": "assert_title",
+}
+_REC_TWO_ARG_METHODS = {
+    "h_clk": "hover_and_click",
+    "ddrop": "drag_and_drop",
+    "s_opt": "select_option_by_text",
+    "set_v": "set_value",
+}
 
 
 class BaseCase(unittest.TestCase):
     """ <Class seleniumbase.BaseCase> """
 
+    _ad_block_script = None  # Built once by ad_block()
+
     def __init__(self, *args, **kwargs):
         super(BaseCase, self).__init__(*args, **kwargs)
         self.driver = None
         self.environment = None
         self.env = None  # Add a shortened version of self.environment
-        self.__page_sources = []
+        self.__page_sources = collections.deque(maxlen=64)  # Nested iframes
         self.__extra_actions = []
         self.__js_start_time = 0
+        self.__js_time_offset_ms = None
         self.__set_c_from_switch = False
         self.__called_setup = False
         self.__called_teardown = False
+        self.__scope_ok = False
         self.__start_time_ms = None
         self.__requests_timeout = None
+        self.__requests_session = None
+        self.__link_status_cache = {}
+        self.__unique_links_cache = (None, None)
+        self.__pdf_text_cache = {}
+        self.__totp_cache = {}
+        self.__browser_downloads_folder = (None, None)  # (driver, path)
         self.__screenshot_count = 0
+        self.__saved_cookies_folder = None
+        self.__created_cookies_folder = False
         self.__will_be_skipped = False
         self.__passed_then_skipped = False
         self.__last_url_of_deferred_assert = "data:,"
         self.__last_page_load_url = "data:,"
+        self.__iframe_probe_cache = {}  # URL => Has iframes (until reload)
+        self.__last_ready_state = (None, 0)  # (driver, time) of "complete"
         self.__last_page_screenshot = None
         self.__last_page_screenshot_png = None
         self.__last_page_url = None
@@ -103,7 +449,7 @@ class BaseCase(unittest.TestCase):
         self.__device_width = None
         self.__device_height = None
         self.__device_pixel_ratio = None
-        self.__driver_browser_map = {}
+        self.__driver_browser_map = {}  # Maps driver.session_id to browser
         self.__changed_jqc_theme = False
         self.__jqc_default_theme = None
         self.__jqc_default_color = None
@@ -112,6 +458,7 @@ class BaseCase(unittest.TestCase):
         self._language = "English"
         self._presentation_slides = {}
         self._presentation_transition = {}
+        self._presentation_chart_libs = {}  # Name => Chart libs imported
         self._rec_overrides_switch = True  # Recorder-Mode uses set_c vs switch
         self._sb_test_identifier = None
         self._html_report_extra = []  # (Used by pytest_plugin.py)
@@ -137,6 +484,8 @@ class BaseCase(unittest.TestCase):
             msg = 'Did you forget to prefix your URL with "http:" or "https:"?'
             raise Exception('Invalid URL: "%s"\n%s' % (url, msg))
         self.__last_page_load_url = None
+        self.__last_ready_state = (None, 0)
+        self.__iframe_probe_cache.clear()
         js_utils.clear_out_console_logs(self.driver)
         if url.startswith("://"):
             # Convert URLs such as "://google.com" into "https://google.com"
@@ -391,8 +740,8 @@ class BaseCase(unittest.TestCase):
             actions.double_click(element).perform()
         except Exception:
             css_selector = self.convert_to_css_selector(selector, by=by)
-            css_selector = re.escape(css_selector)  # Add "\\" to special chars
-            css_selector = self.__escape_quotes_if_needed(css_selector)
+            # Escape quotes and backslashes for JS
+            css_selector = self.__escape_selector(css_selector)
             double_click_script = (
                 """var targetElement1 = document.querySelector('%s');
                 var clickEvent1 = document.createEvent('MouseEvents');
@@ -400,7 +749,7 @@ class BaseCase(unittest.TestCase):
                 targetElement1.dispatchEvent(clickEvent1);"""
                 % css_selector
             )
-            if ":contains\\(" not in css_selector:
+            if ":contains(" not in css_selector:
                 self.execute_script(double_click_script)
             else:
                 double_click_script = (
@@ -471,8 +820,7 @@ class BaseCase(unittest.TestCase):
             self.__scroll_to_element(element, selector, by)
         try:
             element.clear()  # May need https://stackoverflow.com/a/50691625
-            backspaces = Keys.BACK_SPACE * 42  # Is the answer to everything
-            element.send_keys(backspaces)  # In case autocomplete keeps text
+            element.send_keys(_AUTOFILL_BACKSPACES)  # Autocomplete defense
         except (StaleElementReferenceException, ENI_Exception):
             self.wait_for_ready_state_complete()
             time.sleep(0.16)
@@ -487,8 +835,7 @@ class BaseCase(unittest.TestCase):
             pass  # Clearing the text field first might not be necessary
         self.__demo_mode_pause_if_active(tiny=True)
         pre_action_url = self.driver.current_url
-        if type(text) is int or type(text) is float:
-            text = str(text)
+        text = _coerce_text(text)
         try:
             if not text.endswith("\n"):
                 element.send_keys(text)
@@ -550,8 +897,7 @@ class BaseCase(unittest.TestCase):
         if not self.demo_mode and not self.slow_mode:
             self.__scroll_to_element(element, selector, by)
         pre_action_url = self.driver.current_url
-        if type(text) is int or type(text) is float:
-            text = str(text)
+        text = _coerce_text(text)
         try:
             if not text.endswith("\n"):
                 element.send_keys(text)
@@ -650,8 +996,7 @@ class BaseCase(unittest.TestCase):
         self.scroll_to(selector, by=by, timeout=timeout)
         try:
             element.clear()
-            backspaces = Keys.BACK_SPACE * 42  # Autofill Defense
-            element.send_keys(backspaces)
+            element.send_keys(_AUTOFILL_BACKSPACES)  # Autofill Defense
         except (StaleElementReferenceException, ENI_Exception):
             self.wait_for_ready_state_complete()
             time.sleep(0.16)
@@ -660,8 +1005,7 @@ class BaseCase(unittest.TestCase):
             )
             element.clear()
             try:
-                backspaces = Keys.BACK_SPACE * 42  # Autofill Defense
-                element.send_keys(backspaces)
+                element.send_keys(_AUTOFILL_BACKSPACES)  # Autofill Defense
             except Exception:
                 pass
         except Exception:
@@ -699,6 +1043,8 @@ class BaseCase(unittest.TestCase):
     def refresh_page(self):
         self.__check_scope()
         self.__last_page_load_url = None
+        self.__last_ready_state = (None, 0)
+        self.__iframe_probe_cache.clear()
         js_utils.clear_out_console_logs(self.driver)
         self.driver.refresh()
         self.wait_for_ready_state_complete()
@@ -721,7 +1067,7 @@ class BaseCase(unittest.TestCase):
 
     def get_origin(self):
         self.__check_scope()
-        return self.execute_script("return window.location.origin;")
+        return self.execute_script(_JS_ORIGIN)
 
     def get_page_source(self):
         self.wait_for_ready_state_complete()
@@ -752,6 +1098,8 @@ class BaseCase(unittest.TestCase):
     def go_back(self):
         self.__check_scope()
         self.__last_page_load_url = None
+        self.__last_ready_state = (None, 0)
+        self.__iframe_probe_cache.clear()
         self.driver.back()
         if self.browser == "safari":
             self.wait_for_ready_state_complete()
@@ -762,6 +1110,8 @@ class BaseCase(unittest.TestCase):
     def go_forward(self):
         self.__check_scope()
         self.__last_page_load_url = None
+        self.__last_ready_state = (None, 0)
+        self.__iframe_probe_cache.clear()
         self.driver.forward()
         self.wait_for_ready_state_complete()
         self.__demo_mode_pause_if_active()
@@ -959,8 +1309,7 @@ class BaseCase(unittest.TestCase):
                 )
                 selector = self.__make_css_match_first_element_only(selector)
                 try:
-                    selector = re.escape(selector)
-                    selector = self.__escape_quotes_if_needed(selector)
+                    selector = self.__escape_selector(selector)
                     self.__highlight_with_jquery(selector, loops, o_bs)
                 except Exception:
                     pass  # JQuery probably couldn't load. Skip highlighting.
@@ -1245,8 +1594,8 @@ class BaseCase(unittest.TestCase):
         value = re.escape(value)
         value = self.__escape_quotes_if_needed(value)
         css_selector = self.convert_to_css_selector(selector, by=by)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         script = (
             """document.querySelector('%s').setAttribute('%s','%s');"""
             % (css_selector, attribute, value)
@@ -1265,8 +1614,8 @@ class BaseCase(unittest.TestCase):
         value = re.escape(value)
         value = self.__escape_quotes_if_needed(value)
         css_selector = self.convert_to_css_selector(selector, by=by)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         script = """var $elements = document.querySelectorAll('%s');
                   var index = 0, length = $elements.length;
                   for(; index < length; index++){
@@ -1309,8 +1658,8 @@ class BaseCase(unittest.TestCase):
         attribute = re.escape(attribute)
         attribute = self.__escape_quotes_if_needed(attribute)
         css_selector = self.convert_to_css_selector(selector, by=by)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         script = """document.querySelector('%s').removeAttribute('%s');""" % (
             css_selector,
             attribute,
@@ -1325,8 +1674,8 @@ class BaseCase(unittest.TestCase):
         attribute = re.escape(attribute)
         attribute = self.__escape_quotes_if_needed(attribute)
         css_selector = self.convert_to_css_selector(selector, by=by)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         script = """var $elements = document.querySelectorAll('%s');
                   var index = 0, length = $elements.length;
                   for(; index < length; index++){
@@ -1364,8 +1713,7 @@ class BaseCase(unittest.TestCase):
                 "Exception: Could not convert {%s}(by=%s) to CSS_SELECTOR!"
                 % (selector, by)
             )
-        selector = re.escape(selector)
-        selector = self.__escape_quotes_if_needed(selector)
+        selector = self.__escape_selector(selector)
         script = """var $elm = document.querySelector('%s');
                   $val = window.getComputedStyle($elm).getPropertyValue('%s');
                   return $val;""" % (
@@ -1916,8 +2264,8 @@ class BaseCase(unittest.TestCase):
         css_selector = self.convert_to_css_selector(selector, by=by)
         element = self.wait_for_element_visible(css_selector, timeout=timeout)
         self.__demo_mode_highlight_if_active(css_selector, By.CSS_SELECTOR)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         script = js_utils.get_drag_and_drop_with_offset_script(
             css_selector, x, y
         )
@@ -2262,13 +2610,13 @@ class BaseCase(unittest.TestCase):
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     r_a = self.get_session_storage_item("recorder_activated")
                     if r_a == "yes":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["sk_op", "", "", time_stamp]
                         self.__extra_actions.append(action)
                         self.__set_c_from_switch = True
                         self.set_content_to_frame(frame, timeout=timeout)
                         self.__set_c_from_switch = False
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         origin = self.get_origin()
                         action = ["sw_fr", frame, origin, time_stamp]
                         self.__extra_actions.append(action)
@@ -2290,7 +2638,7 @@ class BaseCase(unittest.TestCase):
                         self.__set_c_from_switch = True
                         self.set_content_to_default()
                         self.__set_c_from_switch = False
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         origin = self.get_origin()
                         action = ["sw_dc", "", origin, time_stamp]
                         self.__extra_actions.append(action)
@@ -2316,12 +2664,11 @@ class BaseCase(unittest.TestCase):
             timeout = self.__get_new_timeout(timeout)
         current_url = self.get_current_url()
         c_tab = self.driver.current_window_handle
-        current_page_source = self.get_page_source()
+        current_page_source = self.get_page_source()  # Waits for page load
         self.execute_script("document.cframe_swap = 0;")
+        # Wait for the iframe. (Its html is only read if it gets swapped in)
         page_actions.switch_to_frame(self.driver, frame, timeout)
-        iframe_html = self.get_page_source()
         self.driver.switch_to.default_content()
-        self.wait_for_ready_state_complete()
         frame_found = False
         o_frame = frame
         if self.is_element_present(frame):
@@ -2346,7 +2693,7 @@ class BaseCase(unittest.TestCase):
         self.__page_sources.append([current_url, current_page_source, c_tab])
 
         if self.recorder_mode and not self.__set_c_from_switch:
-            time_stamp = self.execute_script("return Date.now();")
+            time_stamp = self.__get_js_time_ms()
             action = ["sk_op", "", "", time_stamp]
             self.__extra_actions.append(action)
 
@@ -2356,14 +2703,17 @@ class BaseCase(unittest.TestCase):
             self.open(url)
             self.execute_script("document.cframe_tab = 1;")
         else:
+            page_actions.switch_to_frame(self.driver, o_frame, timeout)
+            iframe_html = self.get_page_source()  # Waits for iframe load
+            self.driver.switch_to.default_content()
             self.set_content(iframe_html)
-            if not self.execute_script("return document.cframe_swap;"):
+            if not self.execute_script(_JS_CFRAME_SWAP):
                 self.execute_script("document.cframe_swap = 1;")
             else:
                 self.execute_script("document.cframe_swap += 1;")
 
         if self.recorder_mode and not self.__set_c_from_switch:
-            time_stamp = self.execute_script("return Date.now();")
+            time_stamp = self.__get_js_time_ms()
             action = ["s_c_f", o_frame, "", time_stamp]
             self.__extra_actions.append(action)
 
@@ -2374,11 +2724,10 @@ class BaseCase(unittest.TestCase):
         then the control will only move above the last iFrame that was entered.
         """
         self.__check_scope()
-        swap_cnt = self.execute_script("return document.cframe_swap;")
-        tab_sta = self.execute_script("return document.cframe_tab;")
+        swap_cnt, tab_sta = self.execute_script(_JS_CFRAME_SWAP_AND_TAB)
 
         if self.recorder_mode and not self.__set_c_from_switch:
-            time_stamp = self.execute_script("return Date.now();")
+            time_stamp = self.__get_js_time_ms()
             action = ["sk_op", "", "", time_stamp]
             self.__extra_actions.append(action)
 
@@ -2406,7 +2755,7 @@ class BaseCase(unittest.TestCase):
             else:
                 self.refresh_page()
             self.execute_script("document.cframe_swap = 0;")
-            self.__page_sources = []
+            self.__page_sources.clear()
         else:
             just_refresh = False
             if swap_cnt and int(swap_cnt) > 0 and len(self.__page_sources) > 0:
@@ -2431,10 +2780,10 @@ class BaseCase(unittest.TestCase):
             if just_refresh:
                 self.refresh_page()
                 self.execute_script("document.cframe_swap = 0;")
-                self.__page_sources = []
+                self.__page_sources.clear()
 
         if self.recorder_mode and not self.__set_c_from_switch:
-            time_stamp = self.execute_script("return Date.now();")
+            time_stamp = self.__get_js_time_ms()
             action = ["s_c_d", nested, "", time_stamp]
             self.__extra_actions.append(action)
 
@@ -2691,10 +3040,11 @@ class BaseCase(unittest.TestCase):
             device_pixel_ratio=d_p_r,
         )
         self._drivers_list.append(new_driver)
-        self.__driver_browser_map[new_driver] = browser_name
+        self.__driver_browser_map[new_driver.session_id] = browser_name
         if switch_to:
             self.driver = new_driver
             self.browser = browser_name
+            self.__js_time_offset_ms = None  # Each driver has its own clock
             if self.headless or self.xvfb:
                 # Make sure the invisible browser window is big enough
                 width = settings.HEADLESS_START_WIDTH
@@ -2769,15 +3119,19 @@ class BaseCase(unittest.TestCase):
         You may need this if using self.get_new_driver() in your code."""
         self.__check_scope()
         self.driver = driver
-        if self.driver in self.__driver_browser_map:
-            self.browser = self.__driver_browser_map[self.driver]
+        self.__js_time_offset_ms = None  # Each driver has its own clock
+        session_id = getattr(self.driver, "session_id", None)
+        if session_id in self.__driver_browser_map:
+            self.browser = self.__driver_browser_map[session_id]
 
     def switch_to_default_driver(self):
         """ Sets self.driver to the default/original driver. """
         self.__check_scope()
         self.driver = self._default_driver
-        if self.driver in self.__driver_browser_map:
-            self.browser = self.__driver_browser_map[self.driver]
+        self.__js_time_offset_ms = None  # Each driver has its own clock
+        session_id = getattr(self.driver, "session_id", None)
+        if session_id in self.__driver_browser_map:
+            self.browser = self.__driver_browser_map[session_id]
 
     def save_screenshot(
         self, name, folder=None, selector=None, by=By.CSS_SELECTOR
@@ -2817,15 +3171,12 @@ class BaseCase(unittest.TestCase):
         if name:
             name = str(name)
         self.__screenshot_count += 1
-        if not name or len(name) == 0:
+        if not name:
             name = "_%s_screenshot.png" % self.__screenshot_count
         else:
-            pre_name = "_%s_" % self.__screenshot_count
-            if len(name) >= 4 and name[-4:].lower() == ".png":
-                name = name[:-4]
-                if len(name) == 0:
-                    name = "screenshot"
-            name = "%s%s.png" % (pre_name, name)
+            if name.lower().endswith(".png"):
+                name = name[:-4] or "screenshot"
+            name = "_%s_%s.png" % (self.__screenshot_count, name)
         if selector and by:
             selector, by = self.__recalculate_selector(selector, by)
             if page_actions.is_element_present(self.driver, selector, by):
@@ -2834,58 +3185,41 @@ class BaseCase(unittest.TestCase):
                 )
         return page_actions.save_screenshot(self.driver, name, test_logpath)
 
-    def save_page_source(self, name, folder=None):
+    def save_page_source(self, name, folder=None, wait=True):
         """Saves the page HTML to the current directory (or given subfolder).
         If the folder specified doesn't exist, it will get created.
         @Params
         name - The file name to save the current page's HTML to.
         folder - The folder to save the file to. (Default = current folder)
+        wait - If True, waits for the page to finish loading first.
         """
-        self.wait_for_ready_state_complete()
+        self.__check_scope()
+        if wait:
+            self.wait_for_ready_state_complete()
         return page_actions.save_page_source(self.driver, name, folder)
 
-    def save_cookies(self, name="cookies.txt"):
-        """ Saves the page cookies to the "saved_cookies" folder. """
-        self.wait_for_ready_state_complete()
+    def save_cookies(self, name="cookies.txt", wait=True):
+        """Saves the page cookies to the "saved_cookies" folder.
+        If "wait" is True, waits for the page to finish loading first."""
+        self.__check_scope()
+        if wait:
+            self.wait_for_ready_state_complete()
         cookies = self.driver.get_cookies()
-        json_cookies = json.dumps(cookies)
-        if name.endswith("/"):
-            raise Exception("Invalid filename for Cookies!")
-        if "/" in name:
-            name = name.split("/")[-1]
-        if len(name) < 1:
-            raise Exception("Filename for Cookies is too short!")
-        if not name.endswith(".txt"):
-            name = name + ".txt"
-        folder = constants.SavedCookies.STORAGE_FOLDER
-        abs_path = os.path.abspath(".")
-        file_path = abs_path + "/%s" % folder
-        if not os.path.exists(file_path):
-            os.makedirs(file_path)
-        cookies_file_path = "%s/%s" % (file_path, name)
-        cookies_file = codecs.open(cookies_file_path, "w+", encoding="utf-8")
-        cookies_file.writelines(json_cookies)
-        cookies_file.close()
+        name = self.__get_cookies_filename(name)
+        file_path = self.__get_saved_cookies_folder(create=True)
+        cookies_file_path = os.path.join(file_path, name)
+        with open(cookies_file_path, "w") as cookies_file:
+            # (The JSON output is ASCII-only, so no encoding is needed)
+            json.dump(cookies, cookies_file, separators=(",", ":"))
 
     def load_cookies(self, name="cookies.txt"):
         """ Loads the page cookies from the "saved_cookies" folder. """
         self.wait_for_ready_state_complete()
-        if name.endswith("/"):
-            raise Exception("Invalid filename for Cookies!")
-        if "/" in name:
-            name = name.split("/")[-1]
-        if len(name) < 1:
-            raise Exception("Filename for Cookies is too short!")
-        if not name.endswith(".txt"):
-            name = name + ".txt"
-        folder = constants.SavedCookies.STORAGE_FOLDER
-        abs_path = os.path.abspath(".")
-        file_path = abs_path + "/%s" % folder
-        cookies_file_path = "%s/%s" % (file_path, name)
-        json_cookies = None
+        name = self.__get_cookies_filename(name)
+        file_path = self.__get_saved_cookies_folder()
+        cookies_file_path = os.path.join(file_path, name)
         with open(cookies_file_path, "r") as f:
-            json_cookies = f.read().strip()
-        cookies = json.loads(json_cookies)
+            cookies = json.load(f)
         for cookie in cookies:
             if "expiry" in cookie:
                 del cookie["expiry"]
@@ -2897,25 +3231,47 @@ class BaseCase(unittest.TestCase):
         self.wait_for_ready_state_complete()
         self.driver.delete_all_cookies()
 
-    def delete_saved_cookies(self, name="cookies.txt"):
+    def delete_saved_cookies(self, name="cookies.txt", wait=False):
         """Deletes the cookies file from the "saved_cookies" folder.
-        Does NOT delete the cookies from the web browser."""
-        self.wait_for_ready_state_complete()
+        Does NOT delete the cookies from the web browser.
+        (This is a local file operation, so it doesn't wait by default.)"""
+        self.__check_scope()
+        if wait:
+            self.wait_for_ready_state_complete()
+        name = self.__get_cookies_filename(name)
+        file_path = self.__get_saved_cookies_folder()
+        cookies_file_path = os.path.join(file_path, name)
+        if os.path.exists(cookies_file_path):
+            if cookies_file_path.endswith(".txt"):
+                os.remove(cookies_file_path)
+
+    def __get_cookies_filename(self, name):
+        """ Returns the ".txt" filename to use for saved cookies. """
         if name.endswith("/"):
             raise Exception("Invalid filename for Cookies!")
-        if "/" in name:
-            name = name.split("/")[-1]
-        if len(name) < 1:
+        name = name.rsplit("/", 1)[-1]
+        if not name:
             raise Exception("Filename for Cookies is too short!")
         if not name.endswith(".txt"):
             name = name + ".txt"
-        folder = constants.SavedCookies.STORAGE_FOLDER
-        abs_path = os.path.abspath(".")
-        file_path = abs_path + "/%s" % folder
-        cookies_file_path = "%s/%s" % (file_path, name)
-        if os.path.exists(cookies_file_path):
-            if cookies_file_path.endswith(".txt"):
-                os.remove(cookies_file_path)
+        return name
+
+    def __get_saved_cookies_folder(self, create=False):
+        """Returns the full path of the "saved_cookies" folder.
+        The path is only resolved once, and (if "create" is True),
+        the folder gets created the first time that it's needed."""
+        if not self.__saved_cookies_folder:
+            self.__saved_cookies_folder = os.path.join(
+                os.path.abspath("."), constants.SavedCookies.STORAGE_FOLDER
+            )
+        if create and not self.__created_cookies_folder:
+            try:
+                os.makedirs(self.__saved_cookies_folder)
+            except OSError:
+                if not os.path.isdir(self.__saved_cookies_folder):
+                    raise
+            self.__created_cookies_folder = True
+        return self.__saved_cookies_folder
 
     def wait_for_ready_state_complete(self, timeout=None):
         self.__check_scope()
@@ -2924,20 +3280,47 @@ class BaseCase(unittest.TestCase):
         if self.timeout_multiplier and timeout == settings.EXTREME_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
         is_ready = js_utils.wait_for_ready_state_complete(self.driver, timeout)
-        self.wait_for_angularjs(timeout=settings.MINI_TIMEOUT)
+        if settings.WAIT_FOR_ANGULARJS:
+            # Only wait for AngularJS on pages that actually use AngularJS
+            try:
+                has_angularjs = self.execute_script(_JS_HAS_ANGULARJS)
+            except Exception:
+                has_angularjs = True  # Let wait_for_angularjs() handle it
+            if has_angularjs:
+                self.wait_for_angularjs(timeout=settings.MINI_TIMEOUT)
         if self.js_checking_on:
             self.assert_no_js_errors()
         if self.ad_block_on and (self.headless or not self.is_chromium()):
             # For Chromium browsers in headed mode, the extension is used
             current_url = self.get_current_url()
             if not current_url == self.__last_page_load_url:
-                if page_actions.is_element_present(
-                    self.driver, "iframe", By.CSS_SELECTOR
-                ):
+                has_iframes = self.__iframe_probe_cache.get(current_url)
+                if not has_iframes:
+                    # (Not cached if False: Ad iframes may be injected later)
+                    has_iframes = page_actions.is_element_present(
+                        self.driver, "iframe", By.CSS_SELECTOR
+                    )
+                    if has_iframes:
+                        if len(self.__iframe_probe_cache) >= 128:
+                            self.__iframe_probe_cache.clear()
+                        self.__iframe_probe_cache[current_url] = True
+                if has_iframes:
                     self.ad_block()
                 self.__last_page_load_url = current_url
+        if is_ready:
+            self.__last_ready_state = (self.driver, shared_utils.monotonic())
         return is_ready
 
+    def __wait_for_ready_state_if_stale(self):
+        """Same as self.wait_for_ready_state_complete(), but skips the check
+        if the page was already "complete" less than 50ms ago. (Back-to-back
+        field updates, such as set_text() => set_value(), check it often.)"""
+        last_driver, last_ready = self.__last_ready_state
+        elapsed = shared_utils.monotonic() - last_ready
+        if last_driver is self.driver and elapsed < 0.05:
+            return True
+        return self.wait_for_ready_state_complete()
+
     def wait_for_angularjs(self, timeout=None, **kwargs):
         self.__check_scope()
         if not timeout:
@@ -2955,21 +3338,23 @@ class BaseCase(unittest.TestCase):
             time.sleep(seconds)
             shared_utils.check_if_time_limit_exceeded()
         else:
-            start_ms = time.time() * 1000.0
-            stop_ms = start_ms + (seconds * 1000.0)
-            for x in range(int(seconds * 5)):
+            deadline = shared_utils.monotonic() + seconds
+            while True:
                 shared_utils.check_if_time_limit_exceeded()
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                remaining = deadline - shared_utils.monotonic()
+                if remaining <= 0:
                     break
-                time.sleep(0.2)
+                time.sleep(min(0.2, remaining))
 
-    def install_addon(self, xpi_file):
+    def install_addon(self, xpi_file, wait=True):
         """Installs a Firefox add-on instantly at run-time.
         @Params
         xpi_file - A file archive in .xpi format.
+        wait - If True, waits for the page to finish loading first.
         """
-        self.wait_for_ready_state_complete()
+        self.__check_scope()
+        if wait:
+            self.wait_for_ready_state_complete()
         if self.browser != "firefox":
             raise Exception(
                 "install_addon(xpi_file) is for Firefox ONLY!\n"
@@ -2979,18 +3364,20 @@ class BaseCase(unittest.TestCase):
         xpi_path = os.path.abspath(xpi_file)
         self.driver.install_addon(xpi_path, temporary=True)
 
-    def activate_design_mode(self):
+    def activate_design_mode(self, wait=True):
         # Activate Chrome's Design Mode, which lets you edit a site directly.
         # See: https://twitter.com/sulco/status/1177559150563344384
-        self.wait_for_ready_state_complete()
-        script = """document.designMode = 'on';"""
-        self.execute_script(script)
+        self.__check_scope()
+        if wait:
+            self.wait_for_ready_state_complete()
+        self.execute_script(_DESIGN_MODE_ON)
 
-    def deactivate_design_mode(self):
+    def deactivate_design_mode(self, wait=True):
         # Deactivate Chrome's Design Mode.
-        self.wait_for_ready_state_complete()
-        script = """document.designMode = 'off';"""
-        self.execute_script(script)
+        self.__check_scope()
+        if wait:
+            self.wait_for_ready_state_complete()
+        self.execute_script(_DESIGN_MODE_OFF)
 
     def activate_recorder(self):
         from seleniumbase.js_code.recorder_js import recorder_js
@@ -2999,10 +3386,7 @@ class BaseCase(unittest.TestCase):
             raise Exception(
                 "The Recorder is only for Chromium browsers: (Chrome or Edge)")
         url = self.driver.current_url
-        if (
-            url.startswith("data:") or url.startswith("about:")
-            or url.startswith("chrome:") or url.startswith("edge:")
-        ):
+        if url.startswith(_RECORDER_BAD_PREFIXES):
             message = (
                 'The URL in Recorder-Mode cannot start with: '
                 '"data:", "about:", "chrome:", or "edge:"!')
@@ -3022,302 +3406,112 @@ class BaseCase(unittest.TestCase):
         except Exception:
             pass
 
-    def __get_recorded_actions_on_active_tab(self):
-        url = self.driver.current_url
-        if (
-            url.startswith("data:") or url.startswith("about:")
-            or url.startswith("chrome:") or url.startswith("edge:")
-        ):
+    def __get_recorded_actions_on_active_tab(self, use_cdp=False):
+        # Get the URL and the recorded actions with a single JS call
+        if use_cdp:
+            # (Runs in the top-level page, even if the driver is in an iframe)
+            result = self.driver.execute_cdp_cmd(
+                "Runtime.evaluate",
+                {
+                    "expression": _CDP_URL_AND_RECORDED_ACTIONS,
+                    "returnByValue": True,
+                },
+            )
+            url, actions = result["result"]["value"]
+        else:
+            url, actions = self.execute_script(_JS_URL_AND_RECORDED_ACTIONS)
+        if url.startswith(_RECORDER_BAD_PREFIXES):
             return []
-        actions = self.get_session_storage_item('recorded_actions')
         if actions:
             actions = json.loads(actions)
             return actions
         else:
             return []
 
-    def __process_recorded_actions(self):
-        import colorama
+    def __get_js_time_ms(self):
+        """Returns the browser's "Date.now()" time without a JS round-trip.
+        The offset between the Python clock and the browser clock is
+        measured once per driver, and then reused for Recorder Mode."""
+        if self.__js_time_offset_ms is None:
+            start_ms = time.time() * 1000.0
+            js_time_ms = self.execute_script(_JS_NOW)
+            stop_ms = time.time() * 1000.0
+            self.__js_time_offset_ms = int(
+                js_time_ms - ((start_ms + stop_ms) / 2.0)
+            )
+        return int(time.time() * 1000.0) + self.__js_time_offset_ms
 
-        raw_actions = []  # All raw actions from sessionStorage
-        srt_actions = []
-        cleaned_actions = []
-        sb_actions = []
-        used_actions = []
+    def __process_recorded_actions(self):
+        used_actions = set()  # Hashable tuples of the actions already seen
         action_dict = {}
-        for window in self.driver.window_handles:
-            self.switch_to_window(window)
-            tab_actions = self.__get_recorded_actions_on_active_tab()
-            for action in tab_actions:
-                if action not in used_actions:
-                    used_actions.append(action)
-                    raw_actions.append(action)
-        for action in self.__extra_actions:
-            if action not in used_actions:
-                used_actions.append(action)
-                raw_actions.append(action)
-        for action in raw_actions:
-            if self._reuse_session:
-                if int(action[3]) < int(self.__js_start_time):
-                    continue
-            # Use key for sorting and preventing duplicates
-            key = str(action[3]) + "-" + str(action[0])
-            action_dict[key] = action
-        for key in sorted(action_dict):
-            # print(action_dict[key])  # For debugging purposes
-            srt_actions.append(action_dict[key])
-        for n in range(len(srt_actions)):
-            if (
-                (srt_actions[n][0] == "begin" or srt_actions[n][0] == "_url_")
-                and n > 0
-                and srt_actions[n-1][0] == "sk_op"
-            ):
-                srt_actions[n][0] = "_skip"
-        for n in range(len(srt_actions)):
-            if (
-                (srt_actions[n][0] == "begin" or srt_actions[n][0] == "_url_")
-                and n > 0
-                and (
-                    srt_actions[n-1][0] == "click"
-                    or srt_actions[n-1][0] == "js_cl"
-                )
-            ):
-                url1 = srt_actions[n-1][2]
-                if url1.endswith("/"):
-                    url1 = url1[:-1]
-                url2 = srt_actions[n][2]
-                if url2.endswith("/"):
-                    url2 = url2[:-1]
-                if url1 == url2:
-                    srt_actions[n][0] = "f_url"
-        for n in range(len(srt_actions)):
-            if (
-                (srt_actions[n][0] == "begin" or srt_actions[n][0] == "_url_")
-                and n > 0
-                and (
-                    srt_actions[n-1][0] == "begin"
-                    or srt_actions[n-1][0] == "_url_"
+        windows = self.driver.window_handles
+        tab_actions_list = []
+        if len(windows) == 1 and hasattr(self.driver, "execute_cdp_cmd"):
+            # A CDP call reads the top-level page without switching windows
+            try:
+                tab_actions_list.append(
+                    self.__get_recorded_actions_on_active_tab(use_cdp=True)
                 )
-            ):
-                url1 = srt_actions[n-1][2]
-                if url1.endswith("/"):
-                    url1 = url1[:-1]
-                url2 = srt_actions[n][2]
-                if url2.endswith("/"):
-                    url2 = url2[:-1]
-                if url1 == url2:
-                    srt_actions[n-1][0] = "_skip"
-        for n in range(len(srt_actions)):
-            if (
-                (srt_actions[n][0] == "begin" or srt_actions[n][0] == "_url_")
-                and n > 0
-                and (
-                    srt_actions[n-1][0] == "click"
-                    or srt_actions[n-1][0] == "js_cl"
-                    or srt_actions[n-1][0] == "input"
+            except Exception:
+                pass  # The active window was closed. Switch windows instead.
+        if not tab_actions_list:
+            for window in windows:
+                self.switch_to_window(window)
+                tab_actions_list.append(
+                    self.__get_recorded_actions_on_active_tab()
                 )
-                and (int(srt_actions[n][3]) - int(srt_actions[n-1][3]) < 6500)
-            ):
+        tab_actions_list.append(self.__extra_actions)
+        js_start_time = int(self.__js_start_time)
+        for tab_actions in tab_actions_list:
+            for action in tab_actions:
+                action_key = tuple(action)
+                if action_key in used_actions:
+                    continue
+                used_actions.add(action_key)
+                time_stamp = int(action[3])
+                if self._reuse_session and time_stamp < js_start_time:
+                    continue
+                # Use (time_stamp, action_type) for sorting and removing dupes
+                action_dict[(time_stamp, action[0])] = action
+        srt_actions = [action_dict[key] for key in sorted(action_dict)]
+        # Rewrite the page loads that were caused by other actions.
+        # (All rules run in one pass. The rule for form submissions runs
+        # one action behind because the rule for repeated page loads can
+        # still change the previous action into a "_skip" action.)
+        len_actions = len(srt_actions)
+        for n in range(1, len_actions + 1):
+            if n < len_actions:
+                prev = srt_actions[n - 1]
+                curr = srt_actions[n]
+                if curr[0] == "begin" or curr[0] == "_url_":
+                    if prev[0] == "sk_op":
+                        curr[0] = "_skip"
+                    elif prev[0] == "click" or prev[0] == "js_cl":
+                        if prev[2].rstrip("/") == curr[2].rstrip("/"):
+                            curr[0] = "f_url"
+                    elif prev[0] == "begin" or prev[0] == "_url_":
+                        if prev[2].rstrip("/") == curr[2].rstrip("/"):
+                            prev[0] = "_skip"
+            if n > 1:
+                prev = srt_actions[n - 2]
+                curr = srt_actions[n - 1]
                 if (
-                    srt_actions[n-1][0] == "click"
-                    or srt_actions[n-1][0] == "js_cl"
+                    (curr[0] == "begin" or curr[0] == "_url_")
+                    and int(curr[3]) - int(prev[3]) < 6500
                 ):
-                    if (
-                        srt_actions[n-1][1].startswith("input")
-                        or srt_actions[n-1][1].startswith("button")
-                    ):
-                        srt_actions[n][0] = "f_url"
-                elif srt_actions[n-1][0] == "input":
-                    if srt_actions[n-1][2].endswith("\n"):
-                        srt_actions[n][0] = "f_url"
-        for n in range(len(srt_actions)):
-            cleaned_actions.append(srt_actions[n])
-        for action in srt_actions:
-            if action[0] == "begin" or action[0] == "_url_":
-                sb_actions.append('self.open("%s")' % action[2])
-            elif action[0] == "f_url":
-                sb_actions.append('self.open_if_not_url("%s")' % action[2])
-            elif action[0] == "click":
-                method = "click"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "js_cl":
-                method = "js_click"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "input":
-                method = "type"
-                text = action[2].replace("\n", "\\n")
-                if '"' not in action[1] and '"' not in text:
-                    sb_actions.append('self.%s("%s", "%s")' % (
-                        method, action[1], text))
-                elif '"' not in action[1] and '"' in text:
-                    sb_actions.append('self.%s("%s", \'%s\')' % (
-                        method, action[1], text))
-                elif '"' in action[1] and '"' not in text:
-                    sb_actions.append('self.%s(\'%s\', "%s")' % (
-                        method, action[1], text))
-                elif '"' in action[1] and '"' in text:
-                    sb_actions.append("self.%s('%s', '%s')" % (
-                        method, action[1], text))
-            elif action[0] == "h_clk":
-                method = "hover_and_click"
-                if '"' not in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s("%s", "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' not in action[1] and '"' in action[2]:
-                    sb_actions.append('self.%s("%s", \'%s\')' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s(\'%s\', "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' in action[2]:
-                    sb_actions.append("self.%s('%s', '%s')" % (
-                        method, action[1], action[2]))
-            elif action[0] == "ddrop":
-                method = "drag_and_drop"
-                if '"' not in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s("%s", "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' not in action[1] and '"' in action[2]:
-                    sb_actions.append('self.%s("%s", \'%s\')' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s(\'%s\', "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' in action[2]:
-                    sb_actions.append("self.%s('%s', '%s')" % (
-                        method, action[1], action[2]))
-            elif action[0] == "s_opt":
-                method = "select_option_by_text"
-                if '"' not in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s("%s", "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' not in action[1] and '"' in action[2]:
-                    sb_actions.append('self.%s("%s", \'%s\')' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s(\'%s\', "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' in action[2]:
-                    sb_actions.append("self.%s('%s', '%s')" % (
-                        method, action[1], action[2]))
-            elif action[0] == "set_v":
-                method = "set_value"
-                if '"' not in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s("%s", "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' not in action[1] and '"' in action[2]:
-                    sb_actions.append('self.%s("%s", \'%s\')' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s(\'%s\', "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' in action[2]:
-                    sb_actions.append("self.%s('%s', '%s')" % (
-                        method, action[1], action[2]))
-            elif action[0] == "cho_f":
-                method = "choose_file"
-                action[2] = action[2].replace("\\", "\\\\")
-                if '"' not in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s("%s", "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' not in action[1] and '"' in action[2]:
-                    sb_actions.append('self.%s("%s", \'%s\')' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' not in action[2]:
-                    sb_actions.append('self.%s(\'%s\', "%s")' % (
-                        method, action[1], action[2]))
-                elif '"' in action[1] and '"' in action[2]:
-                    sb_actions.append("self.%s('%s', '%s')" % (
-                        method, action[1], action[2]))
-            elif action[0] == "sw_fr":
-                method = "switch_to_frame"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "sw_dc":
-                sb_actions.append("self.switch_to_default_content()")
-            elif action[0] == "s_c_f":
-                method = "set_content_to_frame"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "s_c_d":
-                method = "set_content_to_default"
-                nested = action[1]
-                if nested:
-                    sb_actions.append("self.%s()" % method)
-                else:
-                    sb_actions.append("self.%s(nested=False)" % method)
-            elif action[0] == "as_el":
-                method = "assert_element"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "as_ep":
-                method = "assert_element_present"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "asenv":
-                method = "assert_element_not_visible"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "as_lt":
-                method = "assert_link_text"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "as_ti":
-                method = "assert_title"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (method, action[1]))
-            elif action[0] == "as_te" or action[0] == "as_et":
-                method = "assert_text"
-                if action[0] == "as_et":
-                    method = "assert_exact_text"
-                if action[2] != "html":
-                    if '"' not in action[1] and '"' not in action[2]:
-                        sb_actions.append('self.%s("%s", "%s")' % (
-                            method, action[1], action[2]))
-                    elif '"' not in action[1] and '"' in action[2]:
-                        sb_actions.append('self.%s("%s", \'%s\')' % (
-                            method, action[1], action[2]))
-                    elif '"' in action[1] and '"' not in action[2]:
-                        sb_actions.append('self.%s(\'%s\', "%s")' % (
-                            method, action[1], action[2]))
-                    elif '"' in action[1] and '"' in action[2]:
-                        sb_actions.append("self.%s('%s', '%s')" % (
-                            method, action[1], action[2]))
-                else:
-                    if '"' not in action[1]:
-                        sb_actions.append('self.%s("%s")' % (
-                            method, action[1]))
-                    else:
-                        sb_actions.append("self.%s('%s')" % (
-                            method, action[1]))
-            elif action[0] == "c_box":
-                cb_method = "check_if_unchecked"
-                if action[2] == "no":
-                    cb_method = "uncheck_if_checked"
-                if '"' not in action[1]:
-                    sb_actions.append('self.%s("%s")' % (cb_method, action[1]))
-                else:
-                    sb_actions.append("self.%s('%s')" % (cb_method, action[1]))
+                    if prev[0] == "click" or prev[0] == "js_cl":
+                        if (
+                            prev[1].startswith("input")
+                            or prev[1].startswith("button")
+                        ):
+                            curr[0] = "f_url"
+                    elif prev[0] == "input":
+                        if prev[2].endswith("\n"):
+                            curr[0] = "f_url"
+        sb_actions = [
+            sb_action for sb_action in map(self.__get_sb_action, srt_actions)
+            if sb_action  # Actions such as "_skip" don't produce any code
+        ]
 
         filename = self.__get_filename()
         new_file = False
@@ -3351,9 +3545,8 @@ class BaseCase(unittest.TestCase):
 
         file_name = self.__class__.__module__.split(".")[-1] + "_rec.py"
         file_path = "%s/%s" % (recordings_folder, file_name)
-        out_file = codecs.open(file_path, "w+", "utf-8")
-        out_file.writelines("\r\n".join(data))
-        out_file.close()
+        with open(file_path, "wb") as out_file:
+            out_file.write("\r\n".join(data).encode("utf-8"))
         rec_message = ">>> RECORDING SAVED as: "
         if not new_file:
             rec_message = ">>> RECORDING ADDED to: "
@@ -3368,7 +3561,7 @@ class BaseCase(unittest.TestCase):
         c1 = ""
         c2 = ""
         cr = ""
-        if "linux" not in sys.platform:
+        if colorama:
             colorama.init(autoreset=True)
             c1 = colorama.Fore.RED + colorama.Back.LIGHTYELLOW_EX
             c2 = colorama.Fore.LIGHTRED_EX + colorama.Back.LIGHTYELLOW_EX
@@ -3376,6 +3569,58 @@ class BaseCase(unittest.TestCase):
             rec_message = rec_message.replace(">>>", c2 + ">>>" + cr)
         print("\n\n%s%s%s%s\n%s" % (rec_message, c1, file_path, cr, stars))
 
+    def __get_sb_action(self, action):
+        """ Returns the SeleniumBase code for a Recorder Mode action. """
+        if action[0] == "begin" or action[0] == "_url_":
+            return 'self.open("%s")' % action[2]
+        elif action[0] == "f_url":
+            return 'self.open_if_not_url("%s")' % action[2]
+        elif action[0] in _REC_ONE_ARG_METHODS:
+            method = _REC_ONE_ARG_METHODS[action[0]]
+            return self.__get_method_call(method, action[1])
+        elif action[0] in _REC_TWO_ARG_METHODS:
+            method = _REC_TWO_ARG_METHODS[action[0]]
+            return self.__get_method_call(method, action[1], action[2])
+        elif action[0] == "input":
+            text = action[2].replace("\n", "\\n")
+            return self.__get_method_call("type", action[1], text)
+        elif action[0] == "cho_f":
+            action[2] = action[2].replace("\\", "\\\\")
+            return self.__get_method_call("choose_file", action[1], action[2])
+        elif action[0] == "sw_dc":
+            return "self.switch_to_default_content()"
+        elif action[0] == "s_c_d":
+            method = "set_content_to_default"
+            nested = action[1]
+            if nested:
+                return "self.%s()" % method
+            return "self.%s(nested=False)" % method
+        elif action[0] == "as_te" or action[0] == "as_et":
+            method = "assert_text"
+            if action[0] == "as_et":
+                method = "assert_exact_text"
+            if action[2] != "html":
+                return self.__get_method_call(method, action[1], action[2])
+            return self.__get_method_call(method, action[1])
+        elif action[0] == "c_box":
+            cb_method = "check_if_unchecked"
+            if action[2] == "no":
+                cb_method = "uncheck_if_checked"
+            return self.__get_method_call(cb_method, action[1])
+        return None
+
+    def __get_method_call(self, method, *args):
+        """Returns the code for calling a SeleniumBase method with args.
+        Each arg gets wrapped in double quotes unless it already has them,
+        in which case it gets wrapped in single quotes instead."""
+        quoted_args = []
+        for arg in args:
+            if '"' not in arg:
+                quoted_args.append('"%s"' % arg)
+            else:
+                quoted_args.append("'%s'" % arg)
+        return "self.%s(%s)" % (method, ", ".join(quoted_args))
+
     def activate_jquery(self):
         """If "jQuery is not defined", use this method to activate it for use.
         This happens because jQuery is not always defined on web sites."""
@@ -3389,6 +3634,9 @@ class BaseCase(unittest.TestCase):
     def __escape_quotes_if_needed(self, string):
         return js_utils.escape_quotes_if_needed(string)
 
+    def __escape_selector(self, selector):
+        return js_utils.escape_selector(selector)
+
     def bring_to_front(self, selector, by=By.CSS_SELECTOR):
         """Updates the Z-index of a page element to bring it into view.
         Useful when getting a WebDriverException, such as the one below:
@@ -3404,13 +3652,8 @@ class BaseCase(unittest.TestCase):
         except Exception:
             # Don't run action if can't convert to CSS_Selector for JavaScript
             return
-        selector = re.escape(selector)
-        selector = self.__escape_quotes_if_needed(selector)
-        script = (
-            """document.querySelector('%s').style.zIndex = '999999';"""
-            % selector
-        )
-        self.execute_script(script)
+        selector = self.__escape_selector(selector)
+        self.execute_script(_BRING_TO_FRONT_JS % selector)
 
     def highlight_click(
         self, selector, by=By.CSS_SELECTOR, loops=3, scroll=True
@@ -3452,7 +3695,9 @@ class BaseCase(unittest.TestCase):
                         self.driver, element
                     )
                     if abs(scroll_distance) > constants.Values.SSMD:
-                        self.__jquery_slow_scroll_to(selector, by)
+                        self.__jquery_slow_scroll_to(
+                            selector, by, element=element, dist=scroll_distance
+                        )
                     else:
                         self.__slow_scroll_to_element(element)
                 else:
@@ -3487,25 +3732,23 @@ class BaseCase(unittest.TestCase):
             )
             style = element.get_attribute("style")
         if style:
-            if "box-shadow: " in style:
-                box_start = style.find("box-shadow: ")
-                box_end = style.find(";", box_start) + 1
-                original_box_shadow = style[box_start:box_end]
+            box_shadow_match = _BOX_SHADOW_RE.search(style)
+            if box_shadow_match:
+                original_box_shadow = box_shadow_match.group(0)
                 o_bs = original_box_shadow
 
         if ":contains" not in selector and ":first" not in selector:
-            selector = re.escape(selector)
-            selector = self.__escape_quotes_if_needed(selector)
+            selector = self.__escape_selector(selector)
             self.__highlight_with_js(selector, loops, o_bs)
         else:
             selector = self.__make_css_match_first_element_only(selector)
-            selector = re.escape(selector)
-            selector = self.__escape_quotes_if_needed(selector)
+            selector = self.__escape_selector(selector)
             try:
                 self.__highlight_with_jquery(selector, loops, o_bs)
             except Exception:
                 pass  # JQuery probably couldn't load. Skip highlighting.
-        time.sleep(0.065)
+        if loops:
+            time.sleep(0.065)  # Let the final highlight frame settle
 
     def __highlight_with_js(self, selector, loops, o_bs):
         self.wait_for_ready_state_complete()
@@ -3526,16 +3769,15 @@ class BaseCase(unittest.TestCase):
         self.__demo_mode_highlight_if_active(selector, by)
         if not self.demo_mode and not self.slow_mode:
             self.__scroll_to_element(element, selector, by)
-        for i in range(int(times)):
-            try:
-                element.send_keys(Keys.ARROW_UP)
-            except Exception:
-                self.wait_for_ready_state_complete()
-                element = self.wait_for_element_visible(selector)
-                element.send_keys(Keys.ARROW_UP)
-            time.sleep(0.01)
-            if self.slow_mode:
-                time.sleep(0.1)
+        keys = Keys.ARROW_UP * int(times)
+        try:
+            element.send_keys(keys)
+        except Exception:
+            self.wait_for_ready_state_complete()
+            element = self.wait_for_element_visible(selector)
+            element.send_keys(keys)
+        if self.slow_mode:
+            time.sleep(0.1)
 
     def press_down_arrow(self, selector="html", times=1, by=By.CSS_SELECTOR):
         """Simulates pressing the DOWN Arrow on the keyboard.
@@ -3548,16 +3790,15 @@ class BaseCase(unittest.TestCase):
         self.__demo_mode_highlight_if_active(selector, by)
         if not self.demo_mode and not self.slow_mode:
             self.__scroll_to_element(element, selector, by)
-        for i in range(int(times)):
-            try:
-                element.send_keys(Keys.ARROW_DOWN)
-            except Exception:
-                self.wait_for_ready_state_complete()
-                element = self.wait_for_element_visible(selector)
-                element.send_keys(Keys.ARROW_DOWN)
-            time.sleep(0.01)
-            if self.slow_mode:
-                time.sleep(0.1)
+        keys = Keys.ARROW_DOWN * int(times)
+        try:
+            element.send_keys(keys)
+        except Exception:
+            self.wait_for_ready_state_complete()
+            element = self.wait_for_element_visible(selector)
+            element.send_keys(keys)
+        if self.slow_mode:
+            time.sleep(0.1)
 
     def press_left_arrow(self, selector="html", times=1, by=By.CSS_SELECTOR):
         """Simulates pressing the LEFT Arrow on the keyboard.
@@ -3570,16 +3811,15 @@ class BaseCase(unittest.TestCase):
         self.__demo_mode_highlight_if_active(selector, by)
         if not self.demo_mode and not self.slow_mode:
             self.__scroll_to_element(element, selector, by)
-        for i in range(int(times)):
-            try:
-                element.send_keys(Keys.ARROW_LEFT)
-            except Exception:
-                self.wait_for_ready_state_complete()
-                element = self.wait_for_element_visible(selector)
-                element.send_keys(Keys.ARROW_LEFT)
-            time.sleep(0.01)
-            if self.slow_mode:
-                time.sleep(0.1)
+        keys = Keys.ARROW_LEFT * int(times)
+        try:
+            element.send_keys(keys)
+        except Exception:
+            self.wait_for_ready_state_complete()
+            element = self.wait_for_element_visible(selector)
+            element.send_keys(keys)
+        if self.slow_mode:
+            time.sleep(0.1)
 
     def press_right_arrow(self, selector="html", times=1, by=By.CSS_SELECTOR):
         """Simulates pressing the RIGHT Arrow on the keyboard.
@@ -3592,16 +3832,15 @@ class BaseCase(unittest.TestCase):
         self.__demo_mode_highlight_if_active(selector, by)
         if not self.demo_mode and not self.slow_mode:
             self.__scroll_to_element(element, selector, by)
-        for i in range(int(times)):
-            try:
-                element.send_keys(Keys.ARROW_RIGHT)
-            except Exception:
-                self.wait_for_ready_state_complete()
-                element = self.wait_for_element_visible(selector)
-                element.send_keys(Keys.ARROW_RIGHT)
-            time.sleep(0.01)
-            if self.slow_mode:
-                time.sleep(0.1)
+        keys = Keys.ARROW_RIGHT * int(times)
+        try:
+            element.send_keys(keys)
+        except Exception:
+            self.wait_for_ready_state_complete()
+            element = self.wait_for_element_visible(selector)
+            element.send_keys(keys)
+        if self.slow_mode:
+            time.sleep(0.1)
 
     def scroll_to(self, selector, by=By.CSS_SELECTOR, timeout=None):
         """ Fast scroll to destination """
@@ -3645,7 +3884,9 @@ class BaseCase(unittest.TestCase):
                 self.driver, element
             )
             if abs(scroll_distance) > constants.Values.SSMD:
-                self.__jquery_slow_scroll_to(selector, by)
+                self.__jquery_slow_scroll_to(
+                    selector, by, element=element, dist=scroll_distance
+                )
             else:
                 self.__slow_scroll_to_element(element)
         except Exception:
@@ -3667,7 +3908,6 @@ class BaseCase(unittest.TestCase):
         scroll_script = "window.scrollTo(0, 0);"
         try:
             self.execute_script(scroll_script)
-            time.sleep(0.012)
             return True
         except Exception:
             return False
@@ -3678,7 +3918,6 @@ class BaseCase(unittest.TestCase):
         scroll_script = "window.scrollTo(0, 10000);"
         try:
             self.execute_script(scroll_script)
-            time.sleep(0.012)
             return True
         except Exception:
             return False
@@ -3721,51 +3960,48 @@ class BaseCase(unittest.TestCase):
                         self.driver, selector, by, timeout=timeout
                     )
         css_selector = self.convert_to_css_selector(selector, by=by)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         action = None
-        pre_action_url = self.driver.current_url
-        pre_window_count = len(self.driver.window_handles)
+        # The window handles and URL are only needed for switching tabs
+        check_new_tabs = (
+            self.recorder_mode or settings.SWITCH_TO_NEW_TABS_ON_CLICK
+        )
+        pre_action_url = None
+        pre_window_count = 0
+        if check_new_tabs:
+            pre_window_count = len(self.driver.window_handles)
+            if not self.recorder_mode:
+                pre_action_url = self.driver.current_url
         if self.recorder_mode:
-            time_stamp = self.execute_script("return Date.now();")
-            tag_name = None
+            time_stamp = self.__get_js_time_ms()
             href = ""
-            if ":contains\\(" not in css_selector:
-                tag_name = self.execute_script(
-                    "return document.querySelector('%s').tagName.toLowerCase()"
-                    % css_selector
-                )
-            if tag_name == "a":
+            if ":contains(" not in css_selector:
                 href = self.execute_script(
-                    "return document.querySelector('%s').href" % css_selector
+                    "var $elm = document.querySelector('%s');"
+                    "if ($elm.tagName.toLowerCase() == 'a') {"
+                    "return $elm.href;} return '';" % css_selector
                 )
             action = ["js_cl", selector, href, time_stamp]
-        if not all_matches:
-            if ":contains\\(" not in css_selector:
+        if ":contains(" not in css_selector:
+            if not all_matches:
                 self.__js_click(selector, by=by)
             else:
-                click_script = """jQuery('%s')[0].click();""" % css_selector
-                self.safe_execute_script(click_script)
-        else:
-            if ":contains\\(" not in css_selector:
                 self.__js_click_all(selector, by=by)
-            else:
-                click_script = """jQuery('%s').click();""" % css_selector
-                self.safe_execute_script(click_script)
+        else:
+            self.__contains_click(
+                self.convert_to_css_selector(selector, by=by),
+                all_matches=all_matches,
+            )
         if self.recorder_mode and action:
             self.__extra_actions.append(action)
-        latest_window_count = len(self.driver.window_handles)
-        if (
-            latest_window_count > pre_window_count
-            and (
+        if check_new_tabs:
+            latest_window_count = len(self.driver.window_handles)
+            if latest_window_count > pre_window_count and (
                 self.recorder_mode
-                or (
-                    settings.SWITCH_TO_NEW_TABS_ON_CLICK
-                    and self.driver.current_url == pre_action_url
-                )
-            )
-        ):
-            self.switch_to_newest_window()
+                or self.driver.current_url == pre_action_url
+            ):
+                self.switch_to_newest_window()
         self.wait_for_ready_state_complete()
         self.__demo_mode_pause_if_active()
 
@@ -3775,7 +4011,9 @@ class BaseCase(unittest.TestCase):
 
     def jquery_click(self, selector, by=By.CSS_SELECTOR):
         """Clicks an element using jQuery. (Different from using pure JS.)
-        Can be used to click hidden / invisible elements."""
+        Can be used to click hidden / invisible elements.
+        Selectors with ":contains()" get the same native click on the
+        first match, but without needing jQuery to be loaded."""
         self.__check_scope()
         selector, by = self.__recalculate_selector(selector, by, xp_ok=False)
         self.wait_for_element_present(
@@ -3784,9 +4022,7 @@ class BaseCase(unittest.TestCase):
         if self.is_element_visible(selector, by=by):
             self.__demo_mode_highlight_if_active(selector, by)
         selector = self.convert_to_css_selector(selector, by=by)
-        selector = self.__make_css_match_first_element_only(selector)
-        click_script = """jQuery('%s')[0].click();""" % selector
-        self.safe_execute_script(click_script)
+        self.__contains_click(selector)
         self.__demo_mode_pause_if_active()
 
     def jquery_click_all(self, selector, by=By.CSS_SELECTOR):
@@ -3808,92 +4044,100 @@ class BaseCase(unittest.TestCase):
         self.__check_scope()
         selector, by = self.__recalculate_selector(selector, by)
         selector = self.convert_to_css_selector(selector, by=by)
-        selector = self.__make_css_match_first_element_only(selector)
-        hide_script = """jQuery('%s').hide();""" % selector
-        self.safe_execute_script(hide_script)
+        self.__run_elements_action(selector, "hide", first_only=True)
 
     def hide_elements(self, selector, by=By.CSS_SELECTOR):
         """ Hide all elements on the page that match the selector. """
         self.__check_scope()
         selector, by = self.__recalculate_selector(selector, by)
         selector = self.convert_to_css_selector(selector, by=by)
-        hide_script = """jQuery('%s').hide();""" % selector
-        self.safe_execute_script(hide_script)
+        self.__run_elements_action(selector, "hide")
 
     def show_element(self, selector, by=By.CSS_SELECTOR):
         """ Show the first element on the page that matches the selector. """
         self.__check_scope()
         selector, by = self.__recalculate_selector(selector, by)
         selector = self.convert_to_css_selector(selector, by=by)
-        selector = self.__make_css_match_first_element_only(selector)
-        show_script = """jQuery('%s').show(0);""" % selector
-        self.safe_execute_script(show_script)
+        self.__run_elements_action(selector, "show", first_only=True)
 
     def show_elements(self, selector, by=By.CSS_SELECTOR):
         """ Show all elements on the page that match the selector. """
         self.__check_scope()
         selector, by = self.__recalculate_selector(selector, by)
         selector = self.convert_to_css_selector(selector, by=by)
-        show_script = """jQuery('%s').show(0);""" % selector
-        self.safe_execute_script(show_script)
+        self.__run_elements_action(selector, "show")
 
     def remove_element(self, selector, by=By.CSS_SELECTOR):
         """ Remove the first element on the page that matches the selector. """
         self.__check_scope()
         selector, by = self.__recalculate_selector(selector, by)
         selector = self.convert_to_css_selector(selector, by=by)
-        selector = self.__make_css_match_first_element_only(selector)
-        remove_script = """jQuery('%s').remove();""" % selector
-        self.safe_execute_script(remove_script)
+        self.__run_elements_action(selector, "remove", first_only=True)
 
     def remove_elements(self, selector, by=By.CSS_SELECTOR):
         """ Remove all elements on the page that match the selector. """
         self.__check_scope()
         selector, by = self.__recalculate_selector(selector, by)
         selector = self.convert_to_css_selector(selector, by=by)
-        remove_script = """jQuery('%s').remove();""" % selector
-        self.safe_execute_script(remove_script)
-
-    def ad_block(self):
-        """ Block ads that appear on the current web page. """
-        from seleniumbase.config import ad_block_list
-
-        self.__check_scope()  # Using wait_for_RSC would cause an infinite loop
-        for css_selector in ad_block_list.AD_BLOCK_LIST:
-            css_selector = re.escape(css_selector)  # Add "\\" to special chars
-            css_selector = self.__escape_quotes_if_needed(css_selector)
-            script = (
-                """var $elements = document.querySelectorAll('%s');
-                var index = 0, length = $elements.length;
-                for(; index < length; index++){
-                $elements[index].remove();}"""
-                % css_selector
+        self.__run_elements_action(selector, "remove")
+
+    def __run_elements_action(self, selector, action, first_only=False):
+        """Runs a hide/show/remove action on matching elements with pure JS,
+        which is a single round trip that doesn't need jQuery loaded.
+        Falls back to jQuery for selectors that only jQuery understands,
+        such as ":contains()" from converted LINK_TEXT selectors."""
+        if ":contains(" not in selector:
+            prefix, suffix = _ELEMENTS_ACTION_SCRIPTS[(action, first_only)]
+            script = "".join(
+                (prefix, self.__escape_selector(selector), suffix)
             )
             try:
                 self.execute_script(script)
+                return
             except Exception:
-                pass  # Don't fail test if ad_blocking fails
+                pass  # Maybe a jQuery-only selector. Try again with jQuery.
+        if first_only:
+            selector = self.__make_css_match_first_element_only(selector)
+        prefix, suffix = _JQUERY_ELEMENT_ACTIONS[action]
+        self.safe_execute_script("".join((prefix, selector, suffix)))
 
-    def show_file_choosers(self):
-        """Display hidden file-chooser input fields on sites if present."""
-        css_selector = 'input[type="file"]'
+    def ad_block(self):
+        """ Block ads that appear on the current web page. """
+        self.__check_scope()  # Using wait_for_RSC would cause an infinite loop
+        if not BaseCase._ad_block_script:
+            BaseCase._ad_block_script = self.__get_ad_block_script()
         try:
-            self.show_elements(css_selector)
+            self.execute_script(BaseCase._ad_block_script)
         except Exception:
-            pass
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+            pass  # Don't fail test if ad_blocking fails
+
+    def __get_ad_block_script(self):
+        """Joins the AD_BLOCK_LIST selectors into a single script so that
+        ad_block() only needs one round trip to the driver."""
+        from seleniumbase.config import ad_block_list
+
+        selectors = []
+        for css_selector in ad_block_list.AD_BLOCK_LIST:
+            # Escape quotes and backslashes for JS
+            css_selector = self.__escape_selector(css_selector)
+            selectors.append("'%s'" % css_selector)
         script = (
-            """var $elements = document.querySelectorAll('%s');
+            """var $selectors = [%s];
+            for (var i = 0; i < $selectors.length; i++) {
+            try {
+            var $elements = document.querySelectorAll($selectors[i]);
             var index = 0, length = $elements.length;
             for(; index < length; index++){
-            the_class = $elements[index].getAttribute('class');
-            new_class = the_class.replaceAll('hidden', 'visible');
-            $elements[index].setAttribute('class', new_class);}"""
-            % css_selector
+            $elements[index].remove();}
+            } catch(e) {}}"""
+            % ", ".join(selectors)
         )
+        return script
+
+    def show_file_choosers(self):
+        """Display hidden file-chooser input fields on sites if present."""
         try:
-            self.execute_script(script)
+            self.execute_script(_SHOW_FILE_CHOOSERS_JS)
         except Exception:
             pass
 
@@ -3901,16 +4145,24 @@ class BaseCase(unittest.TestCase):
         self.__check_scope()
         return page_utils.get_domain_url(url)
 
-    def get_beautiful_soup(self, source=None):
+    def get_beautiful_soup(self, source=None, parser=None):
         """BeautifulSoup is a toolkit for dissecting an HTML document
         and extracting what you need. It's great for screen-scraping!
         See: https://www.crummy.com/software/BeautifulSoup/bs4/doc/
+        The faster "lxml" parser is used when available, otherwise
+        "html.parser". Use the "parser" arg to pick a different one.
         """
         from bs4 import BeautifulSoup
+        from bs4 import FeatureNotFound
 
         if not source:
             source = self.get_page_source()
-        soup = BeautifulSoup(source, "html.parser")
+        if parser:
+            return BeautifulSoup(source, parser)
+        try:
+            soup = BeautifulSoup(source, "lxml")
+        except FeatureNotFound:
+            soup = BeautifulSoup(source, "html.parser")
         return soup
 
     def get_unique_links(self):
@@ -3919,9 +4171,16 @@ class BaseCase(unittest.TestCase):
         "a"->"href", "img"->"src", "link"->"href", and "script"->"src".
         """
         page_url = self.get_current_url()
-        soup = self.get_beautiful_soup(self.get_page_source())
-        links = page_utils._get_unique_links(page_url, soup)
-        return links
+        source = self.get_page_source()
+        key = (page_url, hash(source))
+        if self.__unique_links_cache[0] != key:
+            try:
+                links = page_utils._get_unique_links_lxml(page_url, source)
+            except Exception:
+                soup = self.get_beautiful_soup(source)
+                links = page_utils._get_unique_links(page_url, soup)
+            self.__unique_links_cache = (key, links)
+        return list(self.__unique_links_cache[1])
 
     def get_link_status_code(self, link, allow_redirects=False, timeout=5):
         """Get the status code of a link.
@@ -3935,7 +4194,10 @@ class BaseCase(unittest.TestCase):
         if timeout < 1:
             timeout = 1
         status_code = page_utils._get_link_status_code(
-            link, allow_redirects=allow_redirects, timeout=timeout
+            link,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+            session=self.__requests_session,
         )
         return status_code
 
@@ -3945,17 +4207,34 @@ class BaseCase(unittest.TestCase):
         self.assertNotEqual(status_code, "404", bad_link_str)
 
     def __get_link_if_404_error(self, link):
-        status_code = str(self.get_link_status_code(link))
-        if status_code == "404":
-            # Verify again to be sure. (In case of multi-threading overload.)
-            status_code = str(self.get_link_status_code(link))
+        key = page_utils._normalize_link(link)
+        status_code = self.__link_status_cache.get(key)
+        if not status_code:
+            status_code = self.__get_404_check_status_code(link)
             if status_code == "404":
-                return link
-            else:
-                return None
+                # Verify again to be sure. (In case of multi-threading.)
+                status_code = self.__get_404_check_status_code(link)
+            self.__link_status_cache[key] = status_code
+        if status_code == "404":
+            return link
         else:
             return None
 
+    def __get_404_check_status_code(self, link):
+        """ Same as get_link_status_code(), but tries HEAD before GET. """
+        timeout = 5
+        if self.__requests_timeout:
+            timeout = self.__requests_timeout
+        if timeout < 1:
+            timeout = 1
+        status_code = page_utils._get_link_status_code(
+            link,
+            timeout=timeout,
+            session=self.__requests_session,
+            head_first=True,  # Doesn't download the body of good links
+        )
+        return str(status_code)
+
     def assert_no_404_errors(self, multithreaded=True, timeout=None):
         """Assert no 404 errors from page links obtained from:
         "a"->"href", "img"->"src", "link"->"href", and "script"->"src".
@@ -3978,11 +4257,16 @@ class BaseCase(unittest.TestCase):
                 raise Exception('The "timeout" cannot be a negative number!')
             self.__requests_timeout = timeout
         broken_links = []
-        if multithreaded:
+        self.__requests_session = page_utils._get_requests_session()
+        if multithreaded and links:
             from multiprocessing.dummy import Pool as ThreadPool
 
-            pool = ThreadPool(10)
-            results = pool.map(self.__get_link_if_404_error, links)
+            workers = min(page_utils.LINK_CHECK_THREADS, len(links))
+            chunksize = max(1, len(links) // (workers * 4))
+            pool = ThreadPool(workers)
+            results = pool.map(
+                self.__get_link_if_404_error, links, chunksize=chunksize
+            )
             pool.close()
             pool.join()
             for result in results:
@@ -3994,6 +4278,7 @@ class BaseCase(unittest.TestCase):
                 if self.__get_link_if_404_error(link):
                     broken_links.append(link)
         self.__requests_timeout = None  # Reset the requests.get() timeout
+        self.__requests_session = None
         if len(broken_links) > 0:
             bad_links_str = "\n".join(broken_links)
             if len(broken_links) == 1:
@@ -4003,8 +4288,6 @@ class BaseCase(unittest.TestCase):
         if self.demo_mode:
             a_t = "ASSERT NO 404 ERRORS"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_no_404_errors(self._language)
             messenger_post = "%s" % a_t
             self.__highlight_with_assert_success(messenger_post, "html")
@@ -4016,21 +4299,15 @@ class BaseCase(unittest.TestCase):
         Page links include those obtained from:
         "a"->"href", "img"->"src", "link"->"href", and "script"->"src".
         """
-        page_url = self.get_current_url()
-        soup = self.get_beautiful_soup(self.get_page_source())
-        page_utils._print_unique_links_with_status_codes(page_url, soup)
+        for link in self.get_unique_links():
+            status_code = page_utils._get_link_status_code(link)
+            print(link, " -> ", status_code)
 
     def __fix_unicode_conversion(self, text):
         """ Fixing Chinese characters when converting from PDF to HTML. """
-        text = text.replace("\u2f8f", "\u884c")
-        text = text.replace("\u2f45", "\u65b9")
-        text = text.replace("\u2f08", "\u4eba")
-        text = text.replace("\u2f70", "\u793a")
-        text = text.replace("\xe2\xbe\x8f", "\xe8\xa1\x8c")
-        text = text.replace("\xe2\xbd\xb0", "\xe7\xa4\xba")
-        text = text.replace("\xe2\xbe\x8f", "\xe8\xa1\x8c")
-        text = text.replace("\xe2\xbd\x85", "\xe6\x96\xb9")
-        return text
+        return _UNICODE_FIX_RE.sub(
+            lambda match: _UNICODE_FIXES[match.group(0)], text
+        )
 
     def get_pdf_text(
         self,
@@ -4077,8 +4354,6 @@ class BaseCase(unittest.TestCase):
             raise Exception("%s is not a PDF file! (Expecting a .pdf)" % pdf)
         file_path = None
         if page_utils.is_valid_url(pdf):
-            from seleniumbase.core import download_helper
-
             downloads_folder = download_helper.get_downloads_folder()
             if nav:
                 if self.get_current_url() != pdf:
@@ -4106,15 +4381,27 @@ class BaseCase(unittest.TestCase):
             page_search = [page]
         else:
             page_search = None
-        pdf_text = extract_text(
+        cache_key = (
             file_path,
-            password="",
-            page_numbers=page_search,
-            maxpages=maxpages,
-            caching=False,
-            codec=codec,
-        )
-        pdf_text = self.__fix_unicode_conversion(pdf_text)
+            tuple(page_search) if page_search else None,
+            maxpages,
+            codec,
+        )
+        mtime = os.path.getmtime(file_path)
+        cached = self.__pdf_text_cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            pdf_text = cached[1]
+        else:
+            pdf_text = extract_text(
+                file_path,
+                password="",
+                page_numbers=page_search,
+                maxpages=maxpages,
+                caching=True,
+                codec=codec,
+            )
+            pdf_text = self.__fix_unicode_conversion(pdf_text)
+            self.__pdf_text_cache[cache_key] = (mtime, pdf_text)
         if wrap:
             pdf_text = pdf_text.replace(" \n", " ")
         pdf_text = pdf_text.strip()  # Remove leading and trailing whitespace
@@ -4182,15 +4469,13 @@ class BaseCase(unittest.TestCase):
 
     def create_folder(self, folder):
         """ Creates a folder of the given name if it doesn't already exist. """
-        if folder.endswith("/"):
-            folder = folder[:-1]
+        folder = folder.rstrip("/")
         if len(folder) < 1:
             raise Exception("Minimum folder name length = 1.")
-        if not os.path.exists(folder):
-            try:
-                os.makedirs(folder)
-            except Exception:
-                pass
+        try:
+            os.makedirs(folder)
+        except Exception:
+            pass  # The folder already exists
 
     def choose_file(
         self, selector, file_path, by=By.CSS_SELECTOR, timeout=None
@@ -4208,7 +4493,11 @@ class BaseCase(unittest.TestCase):
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
         selector, by = self.__recalculate_selector(selector, by)
-        abs_path = os.path.abspath(file_path)
+        file_path = _coerce_text(file_path)
+        if os.path.isabs(file_path):
+            abs_path = file_path
+        else:
+            abs_path = os.path.abspath(file_path)
         element = self.wait_for_element_present(
             selector, by=by, timeout=timeout
         )
@@ -4217,8 +4506,6 @@ class BaseCase(unittest.TestCase):
             if not self.demo_mode and not self.slow_mode:
                 self.__scroll_to_element(element, selector, by)
         pre_action_url = self.driver.current_url
-        if type(abs_path) is int or type(abs_path) is float:
-            abs_path = str(abs_path)
         try:
             element.send_keys(abs_path)
         except (StaleElementReferenceException, ENI_Exception):
@@ -4240,11 +4527,18 @@ class BaseCase(unittest.TestCase):
             self.__slow_mode_pause_if_active()
 
     def save_element_as_image_file(
-        self, selector, file_name, folder=None, overlay_text=""
+        self,
+        selector,
+        file_name,
+        folder=None,
+        overlay_text="",
+        compress_level=1,
     ):
         """Take a screenshot of an element and save it as an image file.
         If no folder is specified, will save it to the current folder.
-        If overlay_text is provided, will add that to the saved image."""
+        If overlay_text is provided, will add that to the saved image.
+        compress_level is the PNG zlib level (0-9) used for overlays.
+        (Higher levels make smaller files, but take longer to save.)"""
         element = self.wait_for_element_visible(selector)
         element_png = element.screenshot_as_png
         if len(file_name.split(".")[0]) < 1:
@@ -4260,30 +4554,29 @@ class BaseCase(unittest.TestCase):
                 image_file_path = "%s/%s" % (folder, file_name)
         if not image_file_path:
             image_file_path = file_name
-        with open(image_file_path, "wb") as file:
-            file.write(element_png)
-        # Add a text overlay if given
-        if type(overlay_text) is str and len(overlay_text) > 0:
+        if not (type(overlay_text) is str and len(overlay_text) > 0):
+            with open(image_file_path, "wb") as file:
+                file.write(element_png)
+        else:
+            # Add the text overlay to the in-memory screenshot, then save
+            # once. (Skips writing the PNG and reading it back from disk.)
+            import io
             from PIL import Image, ImageDraw
 
             text_rows = overlay_text.split("\n")
             len_text_rows = len(text_rows)
-            max_width = 0
-            for text_row in text_rows:
-                if len(text_row) > max_width:
-                    max_width = len(text_row)
-            image = Image.open(image_file_path)
+            max_width = max(map(len, text_rows))  # split() is never empty
+            rect_w = (max_width * 6) + 6
+            rect_h = 16 * len_text_rows
+            image = Image.open(io.BytesIO(element_png))
             draw = ImageDraw.Draw(image)
-            draw.rectangle(
-                (0, 0, (max_width * 6) + 6, 16 * len_text_rows),
-                fill=(236, 236, 28),
-            )
+            draw.rectangle((0, 0, rect_w, rect_h), fill=(236, 236, 28))
             draw.text(
                 (4, 2),  # Coordinates
                 overlay_text,  # Text
                 (8, 38, 176),  # Color
             )
-            image.save(image_file_path, "PNG", quality=100, optimize=True)
+            image.save(image_file_path, "PNG", compress_level=compress_level)
 
     def download_file(self, file_url, destination_folder=None):
         """Downloads the file from the url to the destination folder.
@@ -4291,8 +4584,11 @@ class BaseCase(unittest.TestCase):
         (The default [Downloads Folder] = "./downloaded_files")"""
         if not destination_folder:
             destination_folder = constants.Files.DOWNLOADS_FOLDER
-        if not os.path.exists(destination_folder):
+        try:
             os.makedirs(destination_folder)
+        except OSError:
+            if not os.path.isdir(destination_folder):
+                raise
         page_utils._download_file_to(file_url, destination_folder)
 
     def save_file_as(self, file_url, new_file_name, destination_folder=None):
@@ -4319,8 +4615,6 @@ class BaseCase(unittest.TestCase):
           any clicks that download files will also use this folder
           rather than using the browser's default "downloads/" path."""
         self.__check_scope()
-        from seleniumbase.core import download_helper
-
         return download_helper.get_downloads_folder()
 
     def get_browser_downloads_folder(self):
@@ -4330,23 +4624,26 @@ class BaseCase(unittest.TestCase):
         The same problem occurs when using an out-of-date chromedriver.
         """
         self.__check_scope()
+        # The answer only depends on the driver, so it's saved per driver
+        cached_driver, cached_folder = self.__browser_downloads_folder
+        if cached_folder and cached_driver is self.driver:
+            return cached_folder
         if self.is_chromium() and self.guest_mode and not self.headless:
             # Guest Mode (non-headless) can force the default downloads path
-            return os.path.join(os.path.expanduser("~"), "downloads")
+            folder = os.path.join(os.path.expanduser("~"), "downloads")
         elif self.browser == "safari" or self.browser == "ie":
             # Can't change the system [Downloads Folder] on Safari or IE
-            return os.path.join(os.path.expanduser("~"), "downloads")
+            folder = os.path.join(os.path.expanduser("~"), "downloads")
         elif (
             self.driver.capabilities["browserName"].lower() == "chrome"
             and int(self.get_chromedriver_version().split(".")[0]) < 73
             and self.headless
         ):
-            return os.path.join(os.path.expanduser("~"), "downloads")
+            folder = os.path.join(os.path.expanduser("~"), "downloads")
         else:
-            from seleniumbase.core import download_helper
-
-            return download_helper.get_downloads_folder()
-        return os.path.join(os.path.expanduser("~"), "downloads")
+            folder = download_helper.get_downloads_folder()
+        self.__browser_downloads_folder = (self.driver, folder)
+        return folder
 
     def get_path_of_downloaded_file(self, file, browser=False):
         """ Returns the OS path of the downloaded file. """
@@ -4387,12 +4684,11 @@ class BaseCase(unittest.TestCase):
                   Those paths are usually the same. (browser-dependent)
                   (Default: False).
         """
-        if self.is_downloaded_file_present(file, browser=browser):
-            file_path = self.get_path_of_downloaded_file(file, browser=browser)
-            try:
-                os.remove(file_path)
-            except Exception:
-                pass
+        file_path = self.get_path_of_downloaded_file(file, browser=browser)
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass  # (Already gone. FileNotFoundError is an OSError.)
 
     def delete_downloaded_file(self, file, browser=False):
         """Same as self.delete_downloaded_file_if_present()
@@ -4409,12 +4705,7 @@ class BaseCase(unittest.TestCase):
                   Those paths are usually the same. (browser-dependent)
                   (Default: False).
         """
-        if self.is_downloaded_file_present(file, browser=browser):
-            file_path = self.get_path_of_downloaded_file(file, browser=browser)
-            try:
-                os.remove(file_path)
-            except Exception:
-                pass
+        self.delete_downloaded_file_if_present(file, browser=browser)
 
     def assert_downloaded_file(self, file, timeout=None, browser=False):
         """Asserts that the file exists in SeleniumBase's [Downloads Folder].
@@ -4436,26 +4727,21 @@ class BaseCase(unittest.TestCase):
             timeout = settings.LARGE_TIMEOUT
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        deadline = shared_utils.monotonic() + timeout
         downloaded_file_path = self.get_path_of_downloaded_file(file, browser)
         found = False
-        for x in range(int(timeout)):
+        delay = 0.01  # Poll quickly at first, then back off to 0.25s
+        while True:
             shared_utils.check_if_time_limit_exceeded()
-            try:
-                self.assertTrue(
-                    os.path.exists(downloaded_file_path),
-                    "File [%s] was not found in the downloads folder [%s]!"
-                    % (file, self.get_downloads_folder()),
-                )
+            if os.path.exists(downloaded_file_path):
                 found = True
                 break
-            except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(1)
-        if not found and not os.path.exists(downloaded_file_path):
+            remaining = deadline - shared_utils.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 0.25)
+        if not found:
             message = (
                 "File {%s} was not found in the downloads folder {%s} "
                 "after %s seconds! (Or the download didn't complete!)"
@@ -4561,8 +4847,6 @@ class BaseCase(unittest.TestCase):
             a_a = "ASSERT ATTRIBUTE"
             i_n = "in"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_a = SD.translate_assert_attribute(self._language)
                 i_n = SD.translate_in(self._language)
             if not value:
@@ -4570,7 +4854,7 @@ class BaseCase(unittest.TestCase):
                     a_a,
                     attribute,
                     i_n,
-                    by.upper(),
+                    _by_upper(by),
                     selector,
                 )
             else:
@@ -4579,7 +4863,7 @@ class BaseCase(unittest.TestCase):
                     attribute,
                     value,
                     i_n,
-                    by.upper(),
+                    _by_upper(by),
                     selector,
                 )
             self.__highlight_with_assert_success(messenger_post, selector, by)
@@ -4590,30 +4874,24 @@ class BaseCase(unittest.TestCase):
         When a web page initially loads, the title starts as the URL,
         but then the title switches over to the actual page title.
         A slow connection could delay the actual title from displaying."""
-        self.wait_for_ready_state_complete()
         expected = title.strip()
         actual = self.get_page_title().strip()
-        error = (
-            "Expected page title [%s] does not match the actual title [%s]!"
-        )
-        try:
-            self.assertEqual(expected, actual, error % (expected, actual))
-        except Exception:
-            self.wait_for_ready_state_complete()
-            self.sleep(settings.MINI_TIMEOUT)
-            actual = self.get_page_title().strip()
-            try:
-                self.assertEqual(expected, actual, error % (expected, actual))
-            except Exception:
-                self.wait_for_ready_state_complete()
-                self.sleep(settings.MINI_TIMEOUT)
-                actual = self.get_page_title().strip()
+        if actual != expected:
+            # Poll the title instead of sleeping for fixed amounts of time
+            deadline = shared_utils.monotonic() + (2 * settings.MINI_TIMEOUT)
+            while actual != expected and shared_utils.monotonic() < deadline:
+                shared_utils.check_if_time_limit_exceeded()
+                time.sleep(0.025)
+                actual = self.driver.title.strip()
+            if actual != expected:
+                error = (
+                    "Expected page title [%s] does not match "
+                    "the actual title [%s]!"
+                )
                 self.assertEqual(expected, actual, error % (expected, actual))
         if self.demo_mode:
             a_t = "ASSERT TITLE"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_title(self._language)
             messenger_post = "%s: {%s}" % (a_t, title)
             self.__highlight_with_assert_success(messenger_post, "html")
@@ -4622,7 +4900,7 @@ class BaseCase(unittest.TestCase):
             if url and len(url) > 0:
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     if self.get_session_storage_item("pause_recorder") == "no":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["as_ti", title, "", time_stamp]
                         self.__extra_actions.append(action)
         return True
@@ -4643,13 +4921,13 @@ class BaseCase(unittest.TestCase):
             # If unable to get browser logs, skip the assert and return.
             return
 
-        messenger_library = "//cdnjs.cloudflare.com/ajax/libs/messenger"
-        errors = []
-        for entry in browser_logs:
-            if entry["level"] == "SEVERE":
-                if messenger_library not in entry["message"]:
-                    # Add errors if not caused by SeleniumBase dependencies
-                    errors.append(entry)
+        # Only keep errors that aren't caused by SeleniumBase dependencies
+        errors = [
+            entry
+            for entry in browser_logs
+            if entry["level"] == "SEVERE"
+            and _MESSENGER_LIBRARY not in entry["message"]
+        ]
         if len(errors) > 0:
             current_url = self.get_current_url()
             raise Exception(
@@ -4659,8 +4937,6 @@ class BaseCase(unittest.TestCase):
             if self.browser == "chrome" or self.browser == "edge":
                 a_t = "ASSERT NO JS ERRORS"
                 if self._language != "English":
-                    from seleniumbase.fixtures.words import SD
-
                     a_t = SD.translate_assert_no_js_errors(self._language)
                 messenger_post = "%s" % a_t
                 self.__highlight_with_assert_success(messenger_post, "html")
@@ -4694,21 +4970,16 @@ class BaseCase(unittest.TestCase):
             msg = "(Unable to Inspect HTML! -> Only works on Chromium!)"
             print("\n" + msg)
             return msg
-        messenger_library = "//cdnjs.cloudflare.com/ajax/libs/messenger"
         url = self.get_current_url()
         header = "\n* HTML Inspection Results: %s" % url
         results = [header]
+        seen = set(results)  # For fast duplicate checks
         row_count = 0
         for entry in browser_logs:
-            message = entry["message"]
-            if "0:6053 " in message:
-                message = message.split("0:6053")[1]
-            message = message.replace("\\u003C", "<")
-            if message.startswith(' "') and message.count('"') == 2:
-                message = message.split('"')[1]
-            message = "X - " + message
-            if messenger_library not in message:
-                if message not in results:
+            message = _clean_inspector_message(entry["message"])
+            if _MESSENGER_LIBRARY not in message:
+                if message not in seen:
+                    seen.add(message)
                     results.append(message)
                     row_count += 1
         if row_count > 0:
@@ -4722,18 +4993,12 @@ class BaseCase(unittest.TestCase):
     def is_chromium(self):
         """ Return True if the browser is Chrome, Edge, or Opera. """
         self.__check_scope()
-        chromium = False
         browser_name = self.driver.capabilities["browserName"]
-        if browser_name.lower() in ("chrome", "edge", "msedge", "opera"):
-            chromium = True
-        return chromium
+        return browser_name.lower() in _CHROMIUM_BROWSERS
 
     def __fail_if_not_using_chrome(self, method):
-        chrome = False
         browser_name = self.driver.capabilities["browserName"]
-        if browser_name.lower() == "chrome":
-            chrome = True
-        if not chrome:
+        if browser_name.lower() != "chrome":
             from seleniumbase.common.exceptions import NotUsingChromeException
 
             message = (
@@ -4776,7 +5041,9 @@ class BaseCase(unittest.TestCase):
         of chromedriver installed."""
         self.__check_scope()
         self.__fail_if_not_using_chrome("is_chromedriver_too_old()")
-        if int(self.get_chromedriver_version().split(".")[0]) < 73:
+        chrome_dict = self.driver.capabilities["chrome"]
+        chromedriver_version = chrome_dict["chromedriverVersion"]
+        if int(chromedriver_version.split(".")[0]) < 73:
             return True  # chromedriver is too old! Please upgrade!
         return False
 
@@ -4789,24 +5056,20 @@ class BaseCase(unittest.TestCase):
         If the fetched password expires in the next 1.5 seconds, waits
         for a new one before returning it (may take up to 1.5 seconds).
         See https://pyotp.readthedocs.io/en/latest/ for details."""
-        import pyotp
-
         if not totp_key:
             totp_key = settings.TOTP_KEY
 
-        epoch_interval = time.time() / 30.0
-        cycle_lifespan = float(epoch_interval) - int(epoch_interval)
-        if float(cycle_lifespan) > 0.95:
+        remaining = 30.0 - (time.time() % 30.0)
+        if remaining < 1.5:
             # Password expires in the next 1.5 seconds. Wait for a new one.
-            for i in range(30):
-                time.sleep(0.05)
-                epoch_interval = time.time() / 30.0
-                cycle_lifespan = float(epoch_interval) - int(epoch_interval)
-                if not float(cycle_lifespan) > 0.95:
-                    # The new password cycle has begun
-                    break
+            time.sleep(remaining + 0.01)
+
+        totp = self.__totp_cache.get(totp_key)
+        if not totp:
+            import pyotp
 
-        totp = pyotp.TOTP(totp_key)
+            totp = pyotp.TOTP(totp_key)
+            self.__totp_cache[totp_key] = totp
         return str(totp.now())
 
     def convert_css_to_xpath(self, css):
@@ -4846,61 +5109,53 @@ class BaseCase(unittest.TestCase):
         self, selector, text, by=By.CSS_SELECTOR, timeout=None, scroll=True
     ):
         """ This method uses JavaScript to update a text field. """
+        self.__set_value(selector, text, by=by, timeout=timeout, scroll=scroll)
+
+    def __set_value(
+        self, selector, text, by=By.CSS_SELECTOR, timeout=None, scroll=True
+    ):
+        """Same as self.set_value(), but returns the element that was found.
+        (Callers that need the element afterwards can skip finding it again)"""
         self.__check_scope()
         if not timeout:
             timeout = settings.LARGE_TIMEOUT
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
         selector, by = self.__recalculate_selector(selector, by, xp_ok=False)
-        self.wait_for_ready_state_complete()
-        self.wait_for_element_present(selector, by=by, timeout=timeout)
+        self.__wait_for_ready_state_if_stale()
+        found_element = self.wait_for_element_present(
+            selector, by=by, timeout=timeout
+        )
         orginal_selector = selector
         css_selector = self.convert_to_css_selector(selector, by=by)
         self.__demo_mode_highlight_if_active(orginal_selector, by)
         if scroll and not self.demo_mode and not self.slow_mode:
             self.scroll_to(orginal_selector, by=by, timeout=timeout)
-        if type(text) is int or type(text) is float:
-            text = str(text)
+        text = _coerce_text(text)
         value = re.escape(text)
         value = self.__escape_quotes_if_needed(value)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
-        the_type = None
-        if ":contains\\(" not in css_selector:
-            get_type_script = (
-                """return document.querySelector('%s').getAttribute('type');"""
-                % css_selector
-            )
-            the_type = self.execute_script(get_type_script)  # Used later
-            script = """document.querySelector('%s').value='%s';""" % (
-                css_selector,
-                value,
-            )
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
+        if ":contains(" not in css_selector:
+            # Set the value (and trigger sliders) in a single round trip
+            mouse_move = "false" if text.endswith("\n") else "true"
+            script = _SET_VALUE_JS % (css_selector, value, mouse_move)
             self.execute_script(script)
         else:
             script = """jQuery('%s')[0].value='%s';""" % (css_selector, value)
             self.safe_execute_script(script)
         if text.endswith("\n"):
-            element = self.wait_for_element_present(
-                orginal_selector, by=by, timeout=timeout
-            )
-            element.send_keys(Keys.RETURN)
+            try:
+                found_element.send_keys(Keys.RETURN)
+            except StaleElementReferenceException:
+                found_element = self.wait_for_element_present(
+                    orginal_selector, by=by, timeout=timeout
+                )
+                found_element.send_keys(Keys.RETURN)
             if settings.WAIT_FOR_RSC_ON_PAGE_LOADS:
                 self.wait_for_ready_state_complete()
-        else:
-            if the_type == "range" and ":contains\\(" not in css_selector:
-                # Some input sliders need a mouse event to trigger listeners.
-                try:
-                    mouse_move_script = (
-                        """m_elm = document.querySelector('%s');"""
-                        """m_evt = new Event('mousemove');"""
-                        """m_elm.dispatchEvent(m_evt);"""
-                        % css_selector
-                    )
-                    self.execute_script(mouse_move_script)
-                except Exception:
-                    pass
         self.__demo_mode_pause_if_active()
+        return found_element
 
     def js_update_text(self, selector, text, by=By.CSS_SELECTOR, timeout=None):
         """JavaScript + send_keys are used to update a text field.
@@ -4914,17 +5169,20 @@ class BaseCase(unittest.TestCase):
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
         selector, by = self.__recalculate_selector(selector, by)
-        if type(text) is int or type(text) is float:
-            text = str(text)
-        self.set_value(selector, text, by=by, timeout=timeout)
+        text = _coerce_text(text)
+        element = self.__set_value(selector, text, by=by, timeout=timeout)
         if not text.endswith("\n"):
+            # Real key events, so that listeners (Eg. React's) see the change
             try:
-                element = page_actions.wait_for_element_present(
-                    self.driver, selector, by, timeout=0.2
-                )
                 element.send_keys(" " + Keys.BACK_SPACE)
             except Exception:
-                pass
+                try:
+                    element = page_actions.wait_for_element_present(
+                        self.driver, selector, by, timeout=0.2
+                    )
+                    element.send_keys(" " + Keys.BACK_SPACE)
+                except Exception:
+                    pass
 
     def js_type(self, selector, text, by=By.CSS_SELECTOR, timeout=None):
         """Same as self.js_update_text()
@@ -4954,7 +5212,7 @@ class BaseCase(unittest.TestCase):
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
         selector, by = self.__recalculate_selector(selector, by)
-        self.wait_for_ready_state_complete()
+        self.__wait_for_ready_state_if_stale()
         element = page_actions.wait_for_element_present(
             self.driver, selector, by, timeout
         )
@@ -4974,37 +5232,32 @@ class BaseCase(unittest.TestCase):
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
         selector, by = self.__recalculate_selector(selector, by)
-        self.wait_for_ready_state_complete()
+        self.__wait_for_ready_state_if_stale()
         element = page_actions.wait_for_element_present(
             self.driver, selector, by, timeout
         )
-        if element.tag_name == "input" or element.tag_name == "textarea":
-            self.js_update_text(selector, text, by=by, timeout=timeout)
-            return
-        orginal_selector = selector
-        css_selector = self.convert_to_css_selector(selector, by=by)
         if scroll:
-            self.__demo_mode_highlight_if_active(orginal_selector, by)
+            if element.tag_name == "input" or element.tag_name == "textarea":
+                self.js_update_text(selector, text, by=by, timeout=timeout)
+                return
+            self.__demo_mode_highlight_if_active(selector, by)
             if not self.demo_mode and not self.slow_mode:
-                self.scroll_to(orginal_selector, by=by, timeout=timeout)
-        if type(text) is int or type(text) is float:
-            text = str(text)
+                self.scroll_to(selector, by=by, timeout=timeout)
+        text = _coerce_text(text)
         value = re.escape(text)
         value = self.__escape_quotes_if_needed(value)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
-        if ":contains\\(" not in css_selector:
-            script = """document.querySelector('%s').textContent='%s';""" % (
-                css_selector,
-                value,
-            )
-            self.execute_script(script)
-        else:
-            script = """jQuery('%s')[0].textContent='%s';""" % (
-                css_selector,
-                value,
+        # Check the tag and set the textContent in a single round trip
+        script = _SET_TEXT_CONTENT_JS % value
+        try:
+            tag_name = self.execute_script(script, element)
+        except StaleElementReferenceException:
+            element = page_actions.wait_for_element_present(
+                self.driver, selector, by, timeout
             )
-            self.safe_execute_script(script)
+            tag_name = self.execute_script(script, element)
+        if tag_name == "input" or tag_name == "textarea":
+            self.js_update_text(selector, text, by=by, timeout=timeout)
+            return
         self.__demo_mode_pause_if_active()
 
     def jquery_update_text(
@@ -5037,26 +5290,29 @@ class BaseCase(unittest.TestCase):
         self.__demo_mode_pause_if_active()
 
     def get_value(
-        self, selector, by=By.CSS_SELECTOR, timeout=None
+        self, selector, by=By.CSS_SELECTOR, timeout=None, ensure_ready=True
     ):
         """This method uses JavaScript to get the value of an input field.
-        (Works on both input fields and textarea fields.)"""
+        (Works on both input fields and textarea fields.)
+        If ensure_ready is False, doesn't wait for the page to finish loading
+        first. (Saves a call when reading values repeatedly on one page.)"""
         self.__check_scope()
         if not timeout:
             timeout = settings.LARGE_TIMEOUT
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
         selector, by = self.__recalculate_selector(selector, by)
-        self.wait_for_ready_state_complete()
+        if ensure_ready:
+            self.__wait_for_ready_state_if_stale()
         self.wait_for_element_present(selector, by=by, timeout=timeout)
         orginal_selector = selector
         css_selector = self.convert_to_css_selector(selector, by=by)
         self.__demo_mode_highlight_if_active(orginal_selector, by)
         if not self.demo_mode and not self.slow_mode:
             self.scroll_to(orginal_selector, by=by, timeout=timeout)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
-        if ":contains\\(" not in css_selector:
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
+        if ":contains(" not in css_selector:
             script = """return document.querySelector('%s').value;""" % (
                 css_selector
             )
@@ -5173,21 +5429,27 @@ class BaseCase(unittest.TestCase):
                 'A Shadow DOM selector must contain at least one "::shadow "!'
             )
         selectors = selector.split("::shadow ")
+        try:
+            # Usually the whole chain is already there: find it in one call
+            element = self.execute_script(_SHADOW_ELEMENT_JS, selectors)
+            if element:
+                return element
+        except Exception:
+            pass  # Not a CSS chain (Eg. XPath host) or a bad selector
         element = self.get_element(selectors[0])
         selector_chain = selectors[0]
         for selector_part in selectors[1:]:
-            shadow_root = self.execute_script(
-                "return arguments[0].shadowRoot", element
-            )
+            shadow_root = self.execute_script(_JS_SHADOW_ROOT, element)
             if timeout == 0.1 and not shadow_root:
                 raise Exception(
                     "Element {%s} has no shadow root!" % selector_chain
                 )
             elif not shadow_root:
-                time.sleep(2)  # Wait two seconds for the shadow root to appear
-                shadow_root = self.execute_script(
-                    "return arguments[0].shadowRoot", element
-                )
+                # Wait up to two seconds for the shadow root to appear
+                deadline = shared_utils.monotonic() + 2
+                while not shadow_root and shared_utils.monotonic() < deadline:
+                    time.sleep(0.2)
+                    shadow_root = self.execute_script(_JS_SHADOW_ROOT, element)
                 if not shadow_root:
                     raise Exception(
                         "Element {%s} has no shadow root!" % selector_chain
@@ -5232,12 +5494,10 @@ class BaseCase(unittest.TestCase):
         if clear_first:
             try:
                 element.clear()
-                backspaces = Keys.BACK_SPACE * 42  # Autofill Defense
-                element.send_keys(backspaces)
+                element.send_keys(_AUTOFILL_BACKSPACES)  # Autofill Defense
             except Exception:
                 pass
-        if type(text) is int or type(text) is float:
-            text = str(text)
+        text = _coerce_text(text)
         if not text.endswith("\n"):
             element.send_keys(text)
             if settings.WAIT_FOR_RSC_ON_PAGE_LOADS:
@@ -5252,8 +5512,7 @@ class BaseCase(unittest.TestCase):
         element = self.__get_shadow_element(selector)
         try:
             element.clear()
-            backspaces = Keys.BACK_SPACE * 42  # Autofill Defense
-            element.send_keys(backspaces)
+            element.send_keys(_AUTOFILL_BACKSPACES)  # Autofill Defense
         except Exception:
             pass
 
@@ -5262,28 +5521,21 @@ class BaseCase(unittest.TestCase):
         return element.text
 
     def __wait_for_shadow_text_visible(self, text, selector):
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (settings.SMALL_TIMEOUT * 1000.0)
-        for x in range(int(settings.SMALL_TIMEOUT * 10)):
+        text = text.strip()
+        deadline = shared_utils.monotonic() + settings.SMALL_TIMEOUT
+        delay = 0.01  # Poll quickly at first, then back off to 0.1s
+        while True:
             try:
-                actual_text = self.__get_shadow_text(selector).strip()
-                text = text.strip()
-                if text not in actual_text:
-                    msg = (
-                        "Expected text {%s} in element {%s} was not visible!"
-                        % (text, selector)
-                    )
-                    page_actions.timeout_exception(
-                        "ElementNotVisibleException", msg
-                    )
-                return True
+                if text in self.__get_shadow_text(selector).strip():
+                    return True
             except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(0.1)
+                pass
+            remaining = deadline - shared_utils.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 0.1)
         actual_text = self.__get_shadow_text(selector).strip()
-        text = text.strip()
         if text not in actual_text:
             msg = "Expected text {%s} in element {%s} was not visible!" % (
                 text,
@@ -5293,28 +5545,21 @@ class BaseCase(unittest.TestCase):
         return True
 
     def __wait_for_exact_shadow_text_visible(self, text, selector):
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (settings.SMALL_TIMEOUT * 1000.0)
-        for x in range(int(settings.SMALL_TIMEOUT * 10)):
+        text = text.strip()
+        deadline = shared_utils.monotonic() + settings.SMALL_TIMEOUT
+        delay = 0.01  # Poll quickly at first, then back off to 0.1s
+        while True:
             try:
-                actual_text = self.__get_shadow_text(selector).strip()
-                text = text.strip()
-                if text != actual_text:
-                    msg = (
-                        "Expected exact text {%s} in element {%s} not visible!"
-                        "" % (text, selector)
-                    )
-                    page_actions.timeout_exception(
-                        "ElementNotVisibleException", msg
-                    )
-                return True
+                if text == self.__get_shadow_text(selector).strip():
+                    return True
             except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(0.1)
+                pass
+            remaining = deadline - shared_utils.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 0.1)
         actual_text = self.__get_shadow_text(selector).strip()
-        text = text.strip()
         if text != actual_text:
             msg = (
                 "Expected exact text {%s} in element {%s} was not visible!"
@@ -5330,15 +5575,13 @@ class BaseCase(unittest.TestCase):
             i_n = "in"
             by = By.CSS_SELECTOR
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_text(self._language)
                 i_n = SD.translate_in(self._language)
             messenger_post = "%s: {%s} %s %s: %s" % (
                 a_t,
                 text,
                 i_n,
-                by.upper(),
+                _by_upper(by),
                 selector,
             )
             try:
@@ -5356,15 +5599,13 @@ class BaseCase(unittest.TestCase):
             i_n = "in"
             by = By.CSS_SELECTOR
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_exact_text(self._language)
                 i_n = SD.translate_in(self._language)
             messenger_post = "%s: {%s} %s %s: %s" % (
                 a_t,
                 text,
                 i_n,
-                by.upper(),
+                _by_upper(by),
                 selector,
             )
             try:
@@ -5449,10 +5690,10 @@ class BaseCase(unittest.TestCase):
             a_t = "ASSERT"
             by = By.CSS_SELECTOR
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert(self._language)
-            messenger_post = "%s %s: %s" % (a_t, by.upper(), selector)
+            messenger_post = "%s %s: %s" % (
+                a_t, _by_upper(by), selector
+            )
             try:
                 js_utils.activate_jquery(self.driver)
                 js_utils.post_messenger_success_message(
@@ -5470,10 +5711,10 @@ class BaseCase(unittest.TestCase):
             a_t = "ASSERT"
             by = By.CSS_SELECTOR
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert(self._language)
-            messenger_post = "%s %s: %s" % (a_t, by.upper(), selector)
+            messenger_post = "%s %s: %s" % (
+                a_t, _by_upper(by), selector
+            )
             try:
                 js_utils.activate_jquery(self.driver)
                 js_utils.post_messenger_success_message(
@@ -5489,19 +5730,21 @@ class BaseCase(unittest.TestCase):
     def set_local_storage_item(self, key, value):
         self.__check_scope()
         self.execute_script(
-            "window.localStorage.setItem('{}', '{}');".format(key, value)
+            "window.localStorage.setItem(arguments[0], arguments[1]);",
+            str(key),
+            str(value),
         )
 
     def get_local_storage_item(self, key):
         self.__check_scope()
         return self.execute_script(
-            "return window.localStorage.getItem('{}');".format(key)
+            "return window.localStorage.getItem(arguments[0]);", str(key)
         )
 
     def remove_local_storage_item(self, key):
         self.__check_scope()
         self.execute_script(
-            "window.localStorage.removeItem('{}');".format(key)
+            "window.localStorage.removeItem(arguments[0]);", str(key)
         )
 
     def clear_local_storage(self):
@@ -5510,40 +5753,43 @@ class BaseCase(unittest.TestCase):
 
     def get_local_storage_keys(self):
         self.__check_scope()
-        return self.execute_script(
-            "var ls = window.localStorage, keys = []; "
-            "for (var i = 0; i < ls.length; ++i) "
-            "  keys[i] = ls.key(i); "
-            "return keys;"
-        )
+        return self.execute_script(_JS_LOCAL_STORAGE_KEYS)
 
-    def get_local_storage_items(self):
+    def get_local_storage_items(self, keys=None):
+        """Returns a dict of the localStorage items. (All by default)
+        If a list of keys is given, only gets those, in a single JS call.
+        (Missing keys map to None.)"""
         self.__check_scope()
-        return self.execute_script(
-            r"var ls = window.localStorage, items = {}; "
-            "for (var i = 0, k; i < ls.length; ++i) "
-            "  items[k = ls.key(i)] = ls.getItem(k); "
-            "return items;"
-        )
+        if keys is not None:
+            keys = [str(key) for key in keys]
+        return self.execute_script(_JS_LOCAL_STORAGE_ITEMS, keys)
+
+    def remove_local_storage_items(self, keys):
+        """ Removes the localStorage items of the keys in one JS call. """
+        self.__check_scope()
+        keys = [str(key) for key in keys]
+        self.execute_script(_JS_REMOVE_LOCAL_STORAGE_ITEMS, keys)
 
     # Application "Session Storage" controls
 
     def set_session_storage_item(self, key, value):
         self.__check_scope()
         self.execute_script(
-            "window.sessionStorage.setItem('{}', '{}');".format(key, value)
+            "window.sessionStorage.setItem(arguments[0], arguments[1]);",
+            str(key),
+            str(value),
         )
 
     def get_session_storage_item(self, key):
         self.__check_scope()
         return self.execute_script(
-            "return window.sessionStorage.getItem('{}');".format(key)
+            "return window.sessionStorage.getItem(arguments[0]);", str(key)
         )
 
     def remove_session_storage_item(self, key):
         self.__check_scope()
         self.execute_script(
-            "window.sessionStorage.removeItem('{}');".format(key)
+            "window.sessionStorage.removeItem(arguments[0]);", str(key)
         )
 
     def clear_session_storage(self):
@@ -5552,21 +5798,22 @@ class BaseCase(unittest.TestCase):
 
     def get_session_storage_keys(self):
         self.__check_scope()
-        return self.execute_script(
-            "var ls = window.sessionStorage, keys = []; "
-            "for (var i = 0; i < ls.length; ++i) "
-            "  keys[i] = ls.key(i); "
-            "return keys;"
-        )
+        return self.execute_script(_JS_SESSION_STORAGE_KEYS)
 
-    def get_session_storage_items(self):
+    def get_session_storage_items(self, keys=None):
+        """Returns a dict of the sessionStorage items. (All by default)
+        If a list of keys is given, only gets those, in a single JS call.
+        (Missing keys map to None.)"""
         self.__check_scope()
-        return self.execute_script(
-            r"var ls = window.sessionStorage, items = {}; "
-            "for (var i = 0, k; i < ls.length; ++i) "
-            "  items[k = ls.key(i)] = ls.getItem(k); "
-            "return items;"
-        )
+        if keys is not None:
+            keys = [str(key) for key in keys]
+        return self.execute_script(_JS_SESSION_STORAGE_ITEMS, keys)
+
+    def remove_session_storage_items(self, keys):
+        """ Removes the sessionStorage items of the keys in one JS call. """
+        self.__check_scope()
+        keys = [str(key) for key in keys]
+        self.execute_script(_JS_REMOVE_SESSION_STORAGE_ITEMS, keys)
 
     ############
 
@@ -5604,64 +5851,30 @@ class BaseCase(unittest.TestCase):
         self, selector, text, by=By.CSS_SELECTOR, timeout=None, retry=False
     ):
         """ Same as self.update_text() """
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.LARGE_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
-        selector, by = self.__recalculate_selector(selector, by)
         self.update_text(selector, text, by=by, timeout=timeout, retry=retry)
 
     def fill(
         self, selector, text, by=By.CSS_SELECTOR, timeout=None, retry=False
     ):
         """ Same as self.update_text() """
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.LARGE_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
-        selector, by = self.__recalculate_selector(selector, by)
         self.update_text(selector, text, by=by, timeout=timeout, retry=retry)
 
     def write(
         self, selector, text, by=By.CSS_SELECTOR, timeout=None, retry=False
     ):
         """ Same as self.update_text() """
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.LARGE_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
-        selector, by = self.__recalculate_selector(selector, by)
         self.update_text(selector, text, by=by, timeout=timeout, retry=retry)
 
     def send_keys(self, selector, text, by=By.CSS_SELECTOR, timeout=None):
         """ Same as self.add_text() """
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.LARGE_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
-        selector, by = self.__recalculate_selector(selector, by)
         self.add_text(selector, text, by=by, timeout=timeout)
 
     def click_link(self, link_text, timeout=None):
         """ Same as self.click_link_text() """
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.SMALL_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.SMALL_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
         self.click_link_text(link_text, timeout=timeout)
 
     def click_partial_link(self, partial_link_text, timeout=None):
         """ Same as self.click_partial_link_text() """
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.SMALL_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.SMALL_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
         self.click_partial_link_text(partial_link_text, timeout=timeout)
 
     def wait_for_element_visible(
@@ -5689,15 +5902,7 @@ class BaseCase(unittest.TestCase):
         If waiting for elements to be hidden instead of nonexistent,
         use wait_for_element_not_visible() instead.
         """
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.LARGE_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
-        selector, by = self.__recalculate_selector(selector, by)
-        return page_actions.wait_for_element_absent(
-            self.driver, selector, by, timeout
-        )
+        return self.wait_for_element_absent(selector, by=by, timeout=timeout)
 
     def assert_element_not_present(
         self, selector, by=By.CSS_SELECTOR, timeout=None
@@ -5709,13 +5914,7 @@ class BaseCase(unittest.TestCase):
         use assert_element_not_visible() instead.
         (Note that hidden elements are still present in the HTML of the page.)
         Returns True if successful. Default timeout = SMALL_TIMEOUT."""
-        self.__check_scope()
-        if not timeout:
-            timeout = settings.SMALL_TIMEOUT
-        if self.timeout_multiplier and timeout == settings.SMALL_TIMEOUT:
-            timeout = self.__get_new_timeout(timeout)
-        self.wait_for_element_absent(selector, by=by, timeout=timeout)
-        return True
+        return self.assert_element_absent(selector, by=by, timeout=timeout)
 
     def assert_no_broken_links(self, multithreaded=True):
         """ Same as self.assert_no_404_errors() """
@@ -5793,68 +5992,22 @@ class BaseCase(unittest.TestCase):
             name = "default"
         if not theme or theme == "default":
             theme = "serif"
-        valid_themes = [
-            "serif",
-            "white",
-            "black",
-            "beige",
-            "simple",
-            "sky",
-            "league",
-            "moon",
-            "night",
-            "blood",
-            "solarized",
-        ]
         theme = theme.lower()
-        if theme not in valid_themes:
+        if theme not in _REVEAL_THEME_CSS:
             raise Exception(
                 "Theme {%s} not found! Valid themes: %s"
-                % (theme, valid_themes)
+                % (theme, list(_REVEAL_THEME_CSS))
             )
         if not transition or transition == "default":
             transition = "none"
-        valid_transitions = [
-            "none",
-            "slide",
-            "fade",
-            "zoom",
-            "convex",
-            "concave",
-        ]
         transition = transition.lower()
-        if transition not in valid_transitions:
+        if transition not in _REVEAL_TRANSITIONS:
             raise Exception(
                 "Transition {%s} not found! Valid transitions: %s"
-                % (transition, valid_transitions)
+                % (transition, list(_REVEAL_TRANSITIONS))
             )
 
-        reveal_theme_css = None
-        if theme == "serif":
-            reveal_theme_css = constants.Reveal.SERIF_MIN_CSS
-        elif theme == "sky":
-            reveal_theme_css = constants.Reveal.SKY_MIN_CSS
-        elif theme == "white":
-            reveal_theme_css = constants.Reveal.WHITE_MIN_CSS
-        elif theme == "black":
-            reveal_theme_css = constants.Reveal.BLACK_MIN_CSS
-        elif theme == "simple":
-            reveal_theme_css = constants.Reveal.SIMPLE_MIN_CSS
-        elif theme == "league":
-            reveal_theme_css = constants.Reveal.LEAGUE_MIN_CSS
-        elif theme == "moon":
-            reveal_theme_css = constants.Reveal.MOON_MIN_CSS
-        elif theme == "night":
-            reveal_theme_css = constants.Reveal.NIGHT_MIN_CSS
-        elif theme == "beige":
-            reveal_theme_css = constants.Reveal.BEIGE_MIN_CSS
-        elif theme == "blood":
-            reveal_theme_css = constants.Reveal.BLOOD_MIN_CSS
-        elif theme == "solarized":
-            reveal_theme_css = constants.Reveal.SOLARIZED_MIN_CSS
-        else:
-            # Use the default if unable to determine the theme
-            reveal_theme_css = constants.Reveal.SERIF_MIN_CSS
+        reveal_theme_css = _REVEAL_THEME_CSS[theme]
 
         new_presentation = (
             "<html>\n"
@@ -5881,6 +6034,7 @@ class BaseCase(unittest.TestCase):
         self._presentation_slides[name] = []
         self._presentation_slides[name].append(new_presentation)
         self._presentation_transition[name] = transition
+        self._presentation_chart_libs[name] = 0
 
     def add_slide(
         self,
@@ -5925,35 +6079,28 @@ class BaseCase(unittest.TestCase):
             transition = self._presentation_transition[name]
         elif transition == "default":
             transition = "none"
-        valid_transitions = [
-            "none",
-            "slide",
-            "fade",
-            "zoom",
-            "convex",
-            "concave",
-        ]
         transition = transition.lower()
-        if transition not in valid_transitions:
+        if transition not in _REVEAL_TRANSITIONS:
             raise Exception(
                 "Transition {%s} not found! Valid transitions: %s"
-                "" % (transition, valid_transitions)
+                "" % (transition, list(_REVEAL_TRANSITIONS))
             )
         add_line = ""
         if content.startswith("<"):
             add_line = "\n"
-        html = '\n<section data-transition="%s">%s%s' % (
-            transition,
-            add_line,
-            content,
-        )
+        parts = [
+            '\n<section data-transition="%s">%s%s'
+            % (transition, add_line, content)
+        ]
         if image:
-            html += '\n<div flex_div><img rounded src="%s" /></div>' % image
+            parts.append(
+                '\n<div flex_div><img rounded src="%s" /></div>' % image
+            )
         if code:
-            html += "\n<div></div>"
-            html += '\n<pre class="prettyprint">\n%s</pre>' % code
+            parts.append("\n<div></div>")
+            parts.append('\n<pre class="prettyprint">\n%s</pre>' % code)
         if iframe:
-            html += (
+            parts.append(
                 "\n<div></div>"
                 '\n<iframe src="%s" style="width:92%%;height:550px;" '
                 'title="iframe content"></iframe>' % iframe
@@ -5962,11 +6109,16 @@ class BaseCase(unittest.TestCase):
         if content2.startswith("<"):
             add_line = "\n"
         if content2:
-            html += "%s%s" % (add_line, content2)
-        html += '\n<aside class="notes">%s</aside>' % notes
-        html += "\n</section>\n"
+            parts.append(add_line + content2)
+        parts.append('\n<aside class="notes">%s</aside>' % notes)
+        parts.append("\n</section>\n")
 
-        self._presentation_slides[name].append(html)
+        if "<script src=" in content or "<script src=" in content2:
+            # Chart HTML (from extract_chart) may import the chart libraries
+            self._presentation_chart_libs[name] += content.count(
+                _CHART_LIBS
+            ) + content2.count(_CHART_LIBS)
+        self._presentation_slides[name].append("".join(parts))
 
     def save_presentation(
         self, name=None, filename=None, show_notes=False, interval=0
@@ -6005,46 +6157,17 @@ class BaseCase(unittest.TestCase):
         if show_notes:
             show_notes_str = "true"
 
-        the_html = ""
-        for slide in self._presentation_slides[name]:
-            the_html += slide
-
-        the_html += (
-            "\n</div>\n"
-            "</div>\n"
-            '<script src="%s"></script>\n'
-            '<script src="%s"></script>\n'
-            "<script>Reveal.initialize("
-            "{showNotes: %s, slideNumber: true, progress: true, hash: false, "
-            "autoSlide: %s,});"
-            "</script>\n"
-            "</body>\n"
-            "</html>\n"
-            % (
-                constants.Reveal.MIN_JS,
-                constants.PrettifyJS.RUN_PRETTIFY_JS,
-                show_notes_str,
-                interval_ms,
-            )
-        )
+        the_html = "".join(self._presentation_slides[name])
+        the_html += _REVEAL_FOOTER % (show_notes_str, interval_ms)
 
         # Remove duplicate ChartMaker library declarations
-        chart_libs = """
-            <script src="%s"></script>
-            <script src="%s"></script>
-            <script src="%s"></script>
-            <script src="%s"></script>
-            """ % (
-            constants.HighCharts.HC_JS,
-            constants.HighCharts.EXPORTING_JS,
-            constants.HighCharts.EXPORT_DATA_JS,
-            constants.HighCharts.ACCESSIBILITY_JS,
-        )
-        if the_html.count(chart_libs) > 1:
-            chart_libs_comment = "<!-- HighCharts Libraries Imported -->"
-            the_html = the_html.replace(chart_libs, chart_libs_comment)
+        if self._presentation_chart_libs[name] > 1:
             # Only need to import the HighCharts libraries once
-            the_html = the_html.replace(chart_libs_comment, chart_libs, 1)
+            end = the_html.find(_CHART_LIBS) + len(_CHART_LIBS)
+            chart_libs_comment = "<!-- HighCharts Libraries Imported -->"
+            the_html = the_html[:end] + the_html[end:].replace(
+                _CHART_LIBS, chart_libs_comment
+            )
 
         saved_presentations_folder = constants.Presentations.SAVED_FOLDER
         if saved_presentations_folder.endswith("/"):
@@ -6394,18 +6517,7 @@ class BaseCase(unittest.TestCase):
         subtitle = subtitle.replace("'", "\\'")
         unit = unit.replace("'", "\\'")
         self._chart_count += 1
-        # If chart_libs format is changed, also change: save_presentation()
-        chart_libs = """
-            <script src="%s"></script>
-            <script src="%s"></script>
-            <script src="%s"></script>
-            <script src="%s"></script>
-            """ % (
-            constants.HighCharts.HC_JS,
-            constants.HighCharts.EXPORTING_JS,
-            constants.HighCharts.EXPORT_DATA_JS,
-            constants.HighCharts.ACCESSIBILITY_JS,
-        )
+        chart_libs = _CHART_LIBS
         if not libs:
             chart_libs = ""
         chart_css = """
@@ -6799,10 +6911,10 @@ class BaseCase(unittest.TestCase):
                 pass
         else:
             try:
-                start_ms = time.time() * 1000.0
+                start_ms = shared_utils.monotonic() * 1000.0
                 stop_ms = start_ms + (interval * 1000.0)
                 for x in range(int(interval * 10)):
-                    now_ms = time.time() * 1000.0
+                    now_ms = shared_utils.monotonic() * 1000.0
                     if now_ms >= stop_ms:
                         break
                     if len(self.driver.window_handles) == 0:
@@ -8136,7 +8248,7 @@ class BaseCase(unittest.TestCase):
             if url and len(url) > 0:
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     if self.get_session_storage_item("pause_recorder") == "no":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["as_ep", selector, "", time_stamp]
                         self.__extra_actions.append(action)
         return True
@@ -8222,17 +8334,17 @@ class BaseCase(unittest.TestCase):
             )
             a_t = "ASSERT"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert(self._language)
-            messenger_post = "%s %s: %s" % (a_t, by.upper(), selector)
+            messenger_post = "%s %s: %s" % (
+                a_t, _by_upper(by), selector
+            )
             self.__highlight_with_assert_success(messenger_post, selector, by)
         if self.recorder_mode:
             url = self.get_current_url()
             if url and len(url) > 0:
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     if self.get_session_storage_item("pause_recorder") == "no":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["as_el", selector, "", time_stamp]
                         self.__extra_actions.append(action)
         return True
@@ -8299,10 +8411,10 @@ class BaseCase(unittest.TestCase):
                 selector, by = self.__recalculate_selector(selector, by)
                 a_t = "ASSERT"
                 if self._language != "English":
-                    from seleniumbase.fixtures.words import SD
-
                     a_t = SD.translate_assert(self._language)
-                messenger_post = "%s %s: %s" % (a_t, by.upper(), selector)
+                messenger_post = "%s %s: %s" % (
+                    a_t, _by_upper(by), selector
+                )
                 self.__highlight_with_assert_success(
                     messenger_post, selector, by
                 )
@@ -8403,15 +8515,13 @@ class BaseCase(unittest.TestCase):
             a_t = "ASSERT TEXT"
             i_n = "in"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_text(self._language)
                 i_n = SD.translate_in(self._language)
             messenger_post = "%s: {%s} %s %s: %s" % (
                 a_t,
                 text,
                 i_n,
-                by.upper(),
+                _by_upper(by),
                 selector,
             )
             self.__highlight_with_assert_success(messenger_post, selector, by)
@@ -8420,7 +8530,7 @@ class BaseCase(unittest.TestCase):
             if url and len(url) > 0:
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     if self.get_session_storage_item("pause_recorder") == "no":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["as_te", text, selector, time_stamp]
                         self.__extra_actions.append(action)
         return True
@@ -8449,15 +8559,13 @@ class BaseCase(unittest.TestCase):
             a_t = "ASSERT EXACT TEXT"
             i_n = "in"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_exact_text(self._language)
                 i_n = SD.translate_in(self._language)
             messenger_post = "%s: {%s} %s %s: %s" % (
                 a_t,
                 text,
                 i_n,
-                by.upper(),
+                _by_upper(by),
                 selector,
             )
             self.__highlight_with_assert_success(messenger_post, selector, by)
@@ -8466,7 +8574,7 @@ class BaseCase(unittest.TestCase):
             if url and len(url) > 0:
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     if self.get_session_storage_item("pause_recorder") == "no":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["as_et", text, selector, time_stamp]
                         self.__extra_actions.append(action)
         return True
@@ -8477,7 +8585,7 @@ class BaseCase(unittest.TestCase):
         self.__check_scope()
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
+        start_ms = shared_utils.monotonic() * 1000.0
         stop_ms = start_ms + (timeout * 1000.0)
         for x in range(int(timeout * 5)):
             shared_utils.check_if_time_limit_exceeded()
@@ -8488,7 +8596,7 @@ class BaseCase(unittest.TestCase):
                     )
                 return
             except Exception:
-                now_ms = time.time() * 1000.0
+                now_ms = shared_utils.monotonic() * 1000.0
                 if now_ms >= stop_ms:
                     break
                 time.sleep(0.2)
@@ -8502,7 +8610,7 @@ class BaseCase(unittest.TestCase):
         self.__check_scope()
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
+        start_ms = shared_utils.monotonic() * 1000.0
         stop_ms = start_ms + (timeout * 1000.0)
         for x in range(int(timeout * 5)):
             shared_utils.check_if_time_limit_exceeded()
@@ -8513,7 +8621,7 @@ class BaseCase(unittest.TestCase):
                     )
                 return
             except Exception:
-                now_ms = time.time() * 1000.0
+                now_ms = shared_utils.monotonic() * 1000.0
                 if now_ms >= stop_ms:
                     break
                 time.sleep(0.2)
@@ -8564,8 +8672,6 @@ class BaseCase(unittest.TestCase):
         if self.demo_mode:
             a_t = "ASSERT LINK TEXT"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_link_text(self._language)
             messenger_post = "%s: {%s}" % (a_t, link_text)
             self.__highlight_with_assert_success(
@@ -8576,7 +8682,7 @@ class BaseCase(unittest.TestCase):
             if url and len(url) > 0:
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     if self.get_session_storage_item("pause_recorder") == "no":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["as_lt", link_text, "", time_stamp]
                         self.__extra_actions.append(action)
         return True
@@ -8615,8 +8721,6 @@ class BaseCase(unittest.TestCase):
         if self.demo_mode:
             a_t = "ASSERT PARTIAL LINK TEXT"
             if self._language != "English":
-                from seleniumbase.fixtures.words import SD
-
                 a_t = SD.translate_assert_link_text(self._language)
             messenger_post = "%s: {%s}" % (a_t, partial_link_text)
             self.__highlight_with_assert_success(
@@ -8697,7 +8801,7 @@ class BaseCase(unittest.TestCase):
             if url and len(url) > 0:
                 if ("http:") in url or ("https:") in url or ("file:") in url:
                     if self.get_session_storage_item("pause_recorder") == "no":
-                        time_stamp = self.execute_script("return Date.now();")
+                        time_stamp = self.__get_js_time_ms()
                         action = ["asenv", selector, "", time_stamp]
                         self.__extra_actions.append(action)
         return True
@@ -9108,7 +9212,10 @@ class BaseCase(unittest.TestCase):
     ############
 
     def __check_scope(self):
+        if self.__scope_ok:
+            return  # Fast path: A previous check already found "self" ready
         if hasattr(self, "browser"):  # self.browser stores the type of browser
+            self.__scope_ok = True
             return  # All good: setUp() already initialized variables in "self"
         else:
             from seleniumbase.common.exceptions import OutOfScopeException
@@ -9287,8 +9394,8 @@ class BaseCase(unittest.TestCase):
         """ Clicks an element using pure JS. Does not use jQuery. """
         selector, by = self.__recalculate_selector(selector, by)
         css_selector = self.convert_to_css_selector(selector, by=by)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         script = (
             """var simulateClick = function (elem) {
                    var evt = new MouseEvent('click', {
@@ -9308,8 +9415,8 @@ class BaseCase(unittest.TestCase):
         """ Clicks all matching elements using pure JS. (No jQuery) """
         selector, by = self.__recalculate_selector(selector, by)
         css_selector = self.convert_to_css_selector(selector, by=by)
-        css_selector = re.escape(css_selector)  # Add "\\" to special chars
-        css_selector = self.__escape_quotes_if_needed(css_selector)
+        # Escape quotes and backslashes for JS
+        css_selector = self.__escape_selector(css_selector)
         script = (
             """var simulateClick = function (elem) {
                    var evt = new MouseEvent('click', {
@@ -9327,12 +9434,18 @@ class BaseCase(unittest.TestCase):
         )
         self.execute_script(script)
 
-    def __jquery_slow_scroll_to(self, selector, by=By.CSS_SELECTOR):
+    def __jquery_slow_scroll_to(
+        self, selector, by=By.CSS_SELECTOR, element=None, dist=None
+    ):
         selector, by = self.__recalculate_selector(selector, by)
-        element = self.wait_for_element_present(
-            selector, by=by, timeout=settings.SMALL_TIMEOUT
-        )
-        dist = js_utils.get_scroll_distance_to_element(self.driver, element)
+        if not element:
+            element = self.wait_for_element_present(
+                selector, by=by, timeout=settings.SMALL_TIMEOUT
+            )
+        if dist is None:
+            dist = js_utils.get_scroll_distance_to_element(
+                self.driver, element
+            )
         time_offset = 0
         try:
             if dist and abs(dist) > constants.Values.SSMD:
@@ -9365,8 +9478,30 @@ class BaseCase(unittest.TestCase):
             selector, by=by, timeout=settings.SMALL_TIMEOUT
         )
         selector = self.convert_to_css_selector(selector, by=by)
-        selector = self.__make_css_match_first_element_only(selector)
-        click_script = """jQuery('%s')[0].click();""" % selector
+        self.__contains_click(selector)
+
+    def __contains_click(self, selector, all_matches=False):
+        """Clicks elements that match a jQuery ":contains()" selector with
+        pure JS, so that jQuery doesn't need to be loaded for those.
+        (Same as jQuery('...')[0].click(), which is a native click too.)
+        Uses jQuery for other selectors, and for the ones that the browser
+        can't parse, or that only jQuery can apply correctly."""
+        split = _split_contains_selector(selector)
+        if split:
+            base, text, first_only = split
+            script = _CONTAINS_CLICK_JS % (
+                self.__escape_selector(base),
+                self.__escape_selector(text),
+                "true" if (first_only or not all_matches) else "false",
+            )
+            if self.execute_script(script):
+                return
+        if all_matches:
+            click_script = """jQuery('%s').click();"""
+        else:
+            selector = self.__make_css_match_first_element_only(selector)
+            click_script = """jQuery('%s')[0].click();"""
+        click_script = click_script % self.__escape_selector(selector)
         self.safe_execute_script(click_script)
 
     def __get_href_from_link_text(self, link_text, hard_fail=True):
@@ -9510,23 +9645,7 @@ class BaseCase(unittest.TestCase):
         if not_string:
             msg = "Expecting a selector of type: \"<class 'str'>\" (string)!"
             raise Exception('Invalid selector type: "%s"\n%s' % (_type, msg))
-        if page_utils.is_xpath_selector(selector):
-            by = By.XPATH
-        if page_utils.is_link_text_selector(selector):
-            selector = page_utils.get_link_text_from_selector(selector)
-            by = By.LINK_TEXT
-        if page_utils.is_partial_link_text_selector(selector):
-            selector = page_utils.get_partial_link_text_from_selector(selector)
-            by = By.PARTIAL_LINK_TEXT
-        if page_utils.is_name_selector(selector):
-            name = page_utils.get_name_from_selector(selector)
-            selector = '[name="%s"]' % name
-            by = By.CSS_SELECTOR
-        if xp_ok:
-            if ":contains(" in selector and by == By.CSS_SELECTOR:
-                selector = self.convert_css_to_xpath(selector)
-                by = By.XPATH
-        return (selector, by)
+        return _recalculate_selector(selector, by, xp_ok)
 
     def __looks_like_a_page_url(self, url):
         """Returns True if the url parameter looks like a URL. This method
@@ -9592,7 +9711,9 @@ class BaseCase(unittest.TestCase):
                     self.driver, element
                 )
                 if abs(scroll_distance) > constants.Values.SSMD:
-                    self.__jquery_slow_scroll_to(selector, by)
+                    self.__jquery_slow_scroll_to(
+                        selector, by, element=element, dist=scroll_distance
+                    )
                 else:
                     self.__slow_scroll_to_element(element)
             except (StaleElementReferenceException, ENI_Exception):
@@ -9632,7 +9753,9 @@ class BaseCase(unittest.TestCase):
                 self.driver, element
             )
             if abs(scroll_distance) > constants.Values.SSMD:
-                self.__jquery_slow_scroll_to(selector, by)
+                self.__jquery_slow_scroll_to(
+                    selector, by, element=element, dist=scroll_distance
+                )
             else:
                 self.__slow_scroll_to_element(element)
         except Exception:
@@ -9659,20 +9782,17 @@ class BaseCase(unittest.TestCase):
             )
             style = element.get_attribute("style")
         if style:
-            if "box-shadow: " in style:
-                box_start = style.find("box-shadow: ")
-                box_end = style.find(";", box_start) + 1
-                original_box_shadow = style[box_start:box_end]
+            box_shadow_match = _BOX_SHADOW_RE.search(style)
+            if box_shadow_match:
+                original_box_shadow = box_shadow_match.group(0)
                 o_bs = original_box_shadow
 
         if ":contains" not in selector and ":first" not in selector:
-            selector = re.escape(selector)
-            selector = self.__escape_quotes_if_needed(selector)
+            selector = self.__escape_selector(selector)
             self.__highlight_with_js_2(message, selector, o_bs)
         else:
             selector = self.__make_css_match_first_element_only(selector)
-            selector = re.escape(selector)
-            selector = self.__escape_quotes_if_needed(selector)
+            selector = self.__escape_selector(selector)
             try:
                 self.__highlight_with_jquery_2(message, selector, o_bs)
             except Exception:
@@ -9728,6 +9848,7 @@ class BaseCase(unittest.TestCase):
             if hasattr(self, "_using_sb_fixture"):
                 self.test_id = sb_config._test_id
             self.browser = sb_config.browser
+            self.__scope_ok = True  # Lets __check_scope() return right away
             self.data = sb_config.data
             self.var1 = sb_config.var1
             self.var2 = sb_config.var2
@@ -10066,7 +10187,7 @@ class BaseCase(unittest.TestCase):
         # Set the JS start time for Recorder Mode if reusing the session.
         # Use this to skip saving recorded actions from previous tests.
         if self.recorder_mode and self._reuse_session:
-            self.__js_start_time = self.execute_script("return Date.now();")
+            self.__js_start_time = self.__get_js_time_ms()
 
     def __set_last_page_screenshot(self):
         """self.__last_page_screenshot is only for pytest html report logs.
@@ -2,6 +2,7 @@
 Convert CSS selectors into XPath selectors
 """
 from cssselect.xpath import GenericTranslator
+from seleniumbase.common import decorators
 
 
 class ConvertibleToCssTranslator(GenericTranslator):
@@ -52,6 +53,7 @@ class ConvertibleToCssTranslator(GenericTranslator):
         return left.join("//", right)
 
 
+@decorators.memoize()
 def convert_css_to_xpath(css):
     """Convert CSS Selectors to XPath Selectors.
     Example:
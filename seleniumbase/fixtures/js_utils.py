@@ -25,7 +25,7 @@ def wait_for_ready_state_complete(driver, timeout=settings.LARGE_TIMEOUT):
       because readyState == "interactive" may be good enough.
     (Previously, tests would fail immediately if exceeding the timeout.)
     """
-    start_ms = time.time() * 1000.0
+    start_ms = shared_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         shared_utils.check_if_time_limit_exceeded()
@@ -39,7 +39,7 @@ def wait_for_ready_state_complete(driver, timeout=settings.LARGE_TIMEOUT):
             time.sleep(0.01)  # Better be sure everything is done loading
             return True
         else:
-            now_ms = time.time() * 1000.0
+            now_ms = shared_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -181,6 +181,7 @@ def are_quotes_escaped(string):
     return False
 
 
+@decorators.memoize()
 def escape_quotes_if_needed(string):
     """
     re.escape() works differently in Python 3.7.0 than earlier versions:
@@ -197,6 +198,8 @@ def escape_quotes_if_needed(string):
 
     SeleniumBase needs quotes to be properly escaped for Javascript calls.
     """
+    if "'" not in string and '"' not in string:
+        return string  # No quotes (The usual case)
     if are_quotes_escaped(string):
         if string.count("'") != string.count("\\'"):
             string = string.replace("'", "\\'")
@@ -205,6 +208,28 @@ def escape_quotes_if_needed(string):
     return string
 
 
+_JS_STRING_ESCAPES = (
+    ("\\", "\\\\"),
+    ("'", "\\'"),
+    ('"', '\\"'),
+    ("\n", "\\n"),
+)
+
+
+@decorators.memoize()
+def escape_selector(selector):
+    """Escapes backslashes, quotes, and newlines so that the selector
+    can be placed inside a quoted JavaScript string.
+    Unlike re.escape(), only characters that would break the string
+    literal get escaped, so a selector such as "a:contains(Hi)" stays
+    readable inside the generated script."""
+    if not any(char in selector for char in "\\'\"\n"):
+        return selector
+    for char, escaped in _JS_STRING_ESCAPES:
+        selector = selector.replace(char, escaped)
+    return selector
+
+
 def safe_execute_script(driver, script):
     """When executing a script that contains a jQuery command,
     it's important that the jQuery library has been loaded first.
@@ -221,7 +246,7 @@ def wait_for_css_query_selector(
     driver, selector, timeout=settings.SMALL_TIMEOUT
 ):
     element = None
-    start_ms = time.time() * 1000.0
+    start_ms = shared_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         try:
@@ -235,7 +260,7 @@ def wait_for_css_query_selector(
         except Exception:
             element = None
         if not element:
-            now_ms = time.time() * 1000.0
+            now_ms = shared_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -245,64 +270,42 @@ def wait_for_css_query_selector(
 
 
 def highlight_with_js(driver, selector, loops, o_bs):
-    script = (
-        """document.querySelector('%s').style.boxShadow =
-        '0px 0px 6px 6px rgba(128, 128, 128, 0.5)';"""
-        % selector
+    """Runs the whole highlight animation inside the page with a single
+    async script, instead of one round trip per color change."""
+    script = """
+        var done = arguments[arguments.length - 1];
+        var $element = document.querySelector('%s');
+        if (!$element) { done(); return; }
+        var colors = ['rgba(128, 128, 128, 0.5)'];
+        for (var n = 0; n < %s; n++) {
+            colors.push('rgba(255, 0, 0, 1)', 'rgba(128, 0, 128, 1)',
+                'rgba(0, 0, 255, 1)', 'rgba(0, 255, 0, 1)',
+                'rgba(128, 128, 0, 1)', 'rgba(128, 0, 128, 1)');
+        }
+        var index = 0;
+        var nextColor = function() {
+            if (index < colors.length) {
+                $element.style.boxShadow = '0px 0px 6px 6px ' + colors[index];
+                index++;
+                setTimeout(nextColor, 25);
+            } else {
+                $element.style.boxShadow = '%s';
+                done();
+            }
+        };
+        nextColor();""" % (
+        selector,
+        int(loops),
+        o_bs,
     )
+    # Allow up to 1 second per color change, which is how far browsers can
+    # throttle timers in background windows, so that Python doesn't move
+    # on while the animation is still running. (Usually takes 25ms each)
+    timeout = settings.MINI_TIMEOUT + (6 * int(loops) + 2)
     try:
-        driver.execute_script(script)
+        execute_async_script(driver, script, timeout=timeout)
     except Exception:
         return
-    for n in range(loops):
-        script = (
-            """document.querySelector('%s').style.boxShadow =
-            '0px 0px 6px 6px rgba(255, 0, 0, 1)';"""
-            % selector
-        )
-        driver.execute_script(script)
-        time.sleep(0.0181)
-        script = (
-            """document.querySelector('%s').style.boxShadow =
-            '0px 0px 6px 6px rgba(128, 0, 128, 1)';"""
-            % selector
-        )
-        driver.execute_script(script)
-        time.sleep(0.0181)
-        script = (
-            """document.querySelector('%s').style.boxShadow =
-            '0px 0px 6px 6px rgba(0, 0, 255, 1)';"""
-            % selector
-        )
-        driver.execute_script(script)
-        time.sleep(0.0181)
-        script = (
-            """document.querySelector('%s').style.boxShadow =
-            '0px 0px 6px 6px rgba(0, 255, 0, 1)';"""
-            % selector
-        )
-        driver.execute_script(script)
-        time.sleep(0.0181)
-        script = (
-            """document.querySelector('%s').style.boxShadow =
-            '0px 0px 6px 6px rgba(128, 128, 0, 1)';"""
-            % selector
-        )
-        driver.execute_script(script)
-        time.sleep(0.0181)
-        script = (
-            """document.querySelector('%s').style.boxShadow =
-            '0px 0px 6px 6px rgba(128, 0, 128, 1)';"""
-            % selector
-        )
-        driver.execute_script(script)
-        time.sleep(0.0181)
-    script = """document.querySelector('%s').style.boxShadow =
-        '%s';""" % (
-        selector,
-        o_bs,
-    )
-    driver.execute_script(script)
 
 
 def highlight_with_jquery(driver, selector, loops, o_bs):
@@ -793,11 +796,21 @@ def highlight_with_jquery_2(driver, message, selector, o_bs, msg_dur):
     driver.execute_script(script)
 
 
+def get_scroll_position_and_element_location(driver, element):
+    """Returns [window.scrollY, the element's "y" location on the page]
+    with a single round trip to the driver."""
+    script = (
+        "var rect = arguments[0].getBoundingClientRect();"
+        "return [window.scrollY, Math.round(rect.top + window.scrollY)];"
+    )
+    return driver.execute_script(script, element)
+
+
 def get_scroll_distance_to_element(driver, element):
     try:
-        scroll_position = driver.execute_script("return window.scrollY;")
-        element_location = None
-        element_location = element.location["y"]
+        scroll_position, element_location = (
+            get_scroll_position_and_element_location(driver, element)
+        )
         element_location = element_location - 130
         if element_location < 0:
             element_location = 0
@@ -808,20 +821,17 @@ def get_scroll_distance_to_element(driver, element):
 
 
 def scroll_to_element(driver, element):
-    element_location = None
-    try:
-        element_location = element.location["y"]
-    except Exception:
-        # element.location_once_scrolled_into_view  # Old hack
-        return False
-    element_location = element_location - 130
-    if element_location < 0:
-        element_location = 0
-    scroll_script = "window.scrollTo(0, %s);" % element_location
+    # Finds the element's location and scrolls there in one round trip.
+    # (Uses the element reference, so the selector isn't searched again.)
+    scroll_script = (
+        "var rect = arguments[0].getBoundingClientRect();"
+        "var y = Math.round(rect.top + window.pageYOffset) - 130;"
+        "window.scrollTo(0, Math.max(y, 0));"
+    )
     # The old jQuery scroll_script required by=By.CSS_SELECTOR
     # scroll_script = "jQuery('%s')[0].scrollIntoView()" % selector
     try:
-        driver.execute_script(scroll_script)
+        driver.execute_script(scroll_script, element)
         return True
     except Exception:
         return False
@@ -832,11 +842,14 @@ def slow_scroll_to_element(driver, element, browser):
         # IE breaks on slow-scrolling. Do a fast scroll instead.
         scroll_to_element(driver, element)
         return
-    scroll_position = driver.execute_script("return window.scrollY;")
     element_location = None
     try:
-        element_location = element.location["y"]
+        scroll_position, element_location = (
+            get_scroll_position_and_element_location(driver, element)
+        )
     except Exception:
+        pass
+    if element_location is None:
         element.location_once_scrolled_into_view
         return
     element_location = element_location - 130
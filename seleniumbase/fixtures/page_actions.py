@@ -182,7 +182,7 @@ def hover_and_click(
     click_by - the click selector type to search by (Default: By.CSS_SELECTOR)
     timeout - number of seconds to wait for click element to appear after hover
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     element = driver.find_element(by=hover_by, value=hover_selector)
     hover = ActionChains(driver).move_to_element(element)
@@ -193,7 +193,7 @@ def hover_and_click(
             element.click()
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -218,7 +218,7 @@ def hover_element_and_click(
     """
     Similar to hover_and_click(), but assumes top element is already found.
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     hover = ActionChains(driver).move_to_element(element)
     for x in range(int(timeout * 10)):
@@ -228,7 +228,7 @@ def hover_element_and_click(
             element.click()
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -250,7 +250,7 @@ def hover_element_and_double_click(
     click_by=By.CSS_SELECTOR,
     timeout=settings.SMALL_TIMEOUT,
 ):
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     hover = ActionChains(driver).move_to_element(element)
     for x in range(int(timeout * 10)):
@@ -263,7 +263,7 @@ def hover_element_and_double_click(
             actions.perform()
             return element_2
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -295,7 +295,7 @@ def wait_for_element_present(
     A web element object
     """
     element = None
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -303,7 +303,7 @@ def wait_for_element_present(
             element = driver.find_element(by=by, value=selector)
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -339,7 +339,7 @@ def wait_for_element_visible(
     """
     element = None
     is_present = False
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -352,7 +352,7 @@ def wait_for_element_visible(
                 element = None
                 raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -406,7 +406,7 @@ def wait_for_text_visible(
     """
     element = None
     is_present = False
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -419,7 +419,7 @@ def wait_for_text_visible(
                 element = None
                 raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -465,7 +465,7 @@ def wait_for_exact_text_visible(
     """
     element = None
     is_present = False
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -478,7 +478,7 @@ def wait_for_exact_text_visible(
                 element = None
                 raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -532,7 +532,7 @@ def wait_for_attribute(
     element_present = False
     attribute_present = False
     found_value = None
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -556,7 +556,7 @@ def wait_for_attribute(
             else:
                 return element
         except Exception:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -601,13 +601,13 @@ def wait_for_element_absent(
     by - the type of selector being used (Default: By.CSS_SELECTOR)
     timeout - the time to wait for elements in seconds
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
         try:
             driver.find_element(by=by, value=selector)
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -637,14 +637,14 @@ def wait_for_element_not_visible(
     by - the type of selector being used (Default: By.CSS_SELECTOR)
     timeout - the time to wait for the element in seconds
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
         try:
             element = driver.find_element(by=by, value=selector)
             if element.is_displayed():
-                now_ms = time.time() * 1000.0
+                now_ms = s_utils.monotonic() * 1000.0
                 if now_ms >= stop_ms:
                     break
                 time.sleep(0.1)
@@ -679,13 +679,13 @@ def wait_for_text_not_visible(
     @Returns
     A web element object that contains the text searched for
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
         if not is_text_visible(driver, text, selector, by=by):
             return True
-        now_ms = time.time() * 1000.0
+        now_ms = s_utils.monotonic() * 1000.0
         if now_ms >= stop_ms:
             break
         time.sleep(0.1)
@@ -722,7 +722,7 @@ def wait_for_attribute_not_present(
     by - the type of selector being used (Default: By.CSS_SELECTOR)
     timeout - the time to wait for the element attribute in seconds
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -730,7 +730,7 @@ def wait_for_attribute_not_present(
             driver, selector, attribute, value=value, by=by
         ):
             return True
-        now_ms = time.time() * 1000.0
+        now_ms = s_utils.monotonic() * 1000.0
         if now_ms >= stop_ms:
             break
         time.sleep(0.1)
@@ -918,7 +918,7 @@ def wait_for_and_switch_to_alert(driver, timeout=settings.LARGE_TIMEOUT):
     driver - the webdriver object (required)
     timeout - the time to wait for the alert in seconds
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -928,7 +928,7 @@ def wait_for_and_switch_to_alert(driver, timeout=settings.LARGE_TIMEOUT):
             dummy_variable = alert.text  # noqa
             return alert
         except NoAlertPresentException:
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -947,7 +947,7 @@ def switch_to_frame(driver, frame, timeout=settings.SMALL_TIMEOUT):
     """
     from seleniumbase.fixtures import page_utils
 
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     for x in range(int(timeout * 10)):
         s_utils.check_if_time_limit_exceeded()
@@ -968,7 +968,7 @@ def switch_to_frame(driver, frame, timeout=settings.SMALL_TIMEOUT):
                         return True
                     except Exception:
                         pass
-            now_ms = time.time() * 1000.0
+            now_ms = s_utils.monotonic() * 1000.0
             if now_ms >= stop_ms:
                 break
             time.sleep(0.1)
@@ -992,7 +992,7 @@ def switch_to_window(driver, window, timeout=settings.SMALL_TIMEOUT):
     window - the window index or window handle
     timeout - the time to wait for the window in seconds
     """
-    start_ms = time.time() * 1000.0
+    start_ms = s_utils.monotonic() * 1000.0
     stop_ms = start_ms + (timeout * 1000.0)
     if isinstance(window, int):
         for x in range(int(timeout * 10)):
@@ -1002,7 +1002,7 @@ def switch_to_window(driver, window, timeout=settings.SMALL_TIMEOUT):
                 driver.switch_to.window(window_handle)
                 return True
             except IndexError:
-                now_ms = time.time() * 1000.0
+                now_ms = s_utils.monotonic() * 1000.0
                 if now_ms >= stop_ms:
                     break
                 time.sleep(0.1)
@@ -1023,7 +1023,7 @@ def switch_to_window(driver, window, timeout=settings.SMALL_TIMEOUT):
                 driver.switch_to.window(window_handle)
                 return True
             except NoSuchWindowException:
-                now_ms = time.time() * 1000.0
+                now_ms = s_utils.monotonic() * 1000.0
                 if now_ms >= stop_ms:
                     break
                 time.sleep(0.1)
@@ -4,6 +4,21 @@ This module contains useful utility methods.
 import codecs
 import re
 import requests
+from seleniumbase.common import decorators
+
+_requests_session = None  # Shared by link checks for connection reuse
+_requests_pool_size = None  # The LINK_CHECK_THREADS that the pool is for
+# Concurrent link checks. (The connection pool is resized to match when
+# a new value is seen by the next link check.)
+LINK_CHECK_THREADS = 32
+
+# The (tag, attribute) pairs that page links get collected from
+_LINK_ATTRIBUTES = (
+    ("a", "href"),
+    ("img", "src"),
+    ("link", "href"),
+    ("script", "src"),
+)
 
 
 def get_domain_url(url):
@@ -147,6 +162,30 @@ def _get_unique_links(page_url, soup):
     Includes:
         "a"->"href", "img"->"src", "link"->"href", and "script"->"src" links.
     """
+    raw_links = []
+    for tag, attribute in _LINK_ATTRIBUTES:
+        for element in soup.find_all(tag):
+            raw_links.append(element.get(attribute))
+    return _resolve_unique_links(page_url, raw_links)
+
+
+def _get_unique_links_lxml(page_url, source):
+    """
+    Same as _get_unique_links(), but parses the page source with lxml,
+    which collects the link attributes in C instead of walking a
+    BeautifulSoup tree. Raises ImportError if lxml is not installed.
+    """
+    import lxml.html
+
+    root = lxml.html.fromstring(source)
+    raw_links = []
+    for tag, attribute in _LINK_ATTRIBUTES:
+        raw_links.extend(root.xpath("//%s/@%s" % (tag, attribute)))
+    return _resolve_unique_links(page_url, raw_links)
+
+
+def _resolve_unique_links(page_url, raw_links):
+    """ Converts raw "href"/"src" values into unique full URLs. """
     if not page_url.startswith("http://") and not page_url.startswith(
         "https://"
     ):
@@ -158,31 +197,11 @@ def _get_unique_links(page_url, soup):
     base_url = simple_url.split("/")[0]
     full_base_url = prefix + "//" + base_url
 
-    raw_links = []
     raw_unique_links = []
-
-    # Get "href" from all "a" tags
-    links = soup.find_all("a")
-    for link in links:
-        raw_links.append(link.get("href"))
-
-    # Get "src" from all "img" tags
-    img_links = soup.find_all("img")
-    for img_link in img_links:
-        raw_links.append(img_link.get("src"))
-
-    # Get "href" from all "link" tags
-    links = soup.find_all("link")
-    for link in links:
-        raw_links.append(link.get("href"))
-
-    # Get "src" from all "script" tags
-    img_links = soup.find_all("script")
-    for img_link in img_links:
-        raw_links.append(img_link.get("src"))
-
+    seen = set()
     for link in raw_links:
-        if link not in raw_unique_links:
+        if link not in seen:
+            seen.add(link)
             raw_unique_links.append(link)
 
     unique_links = []
@@ -211,44 +230,96 @@ def _get_unique_links(page_url, soup):
     return unique_links
 
 
-def _get_link_status_code(link, allow_redirects=False, timeout=5):
+def _normalize_link(link):
+    """Drops the "#fragment" and lowercases the scheme and host of a link
+    so that equivalent links share the same status code cache key."""
+    link = link.split("#")[0]
+    if "://" not in link:
+        return link
+    scheme, rest = link.split("://", 1)
+    if "/" in rest:
+        host, path = rest.split("/", 1)
+        return "%s://%s/%s" % (scheme.lower(), host.lower(), path)
+    return "%s://%s" % (scheme.lower(), rest.lower())
+
+
+def _get_requests_session():
+    """Returns a shared requests.Session() with a connection pool
+    large enough for multithreaded link checking.
+    The session doesn't keep cookies, so every request stays stateless
+    (like requests.get()), and nothing carries over between tests."""
+    global _requests_session
+    global _requests_pool_size
+    if not _requests_session:
+        from requests.compat import cookielib
+
+        session = requests.Session()
+        session.cookies = requests.cookies.RequestsCookieJar(
+            policy=cookielib.DefaultCookiePolicy(allowed_domains=[])
+        )
+        _requests_session = session
+    if _requests_pool_size != LINK_CHECK_THREADS:
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(
+            pool_connections=LINK_CHECK_THREADS,
+            pool_maxsize=LINK_CHECK_THREADS * 2,
+        )
+        _requests_session.mount("http://", adapter)
+        _requests_session.mount("https://", adapter)
+        _requests_pool_size = LINK_CHECK_THREADS
+    return _requests_session
+
+
+def _get_link_status_code(
+    link, allow_redirects=False, timeout=5, session=None, head_first=False
+):
     """Get the status code of a link.
     If the timeout is exceeded, will return a 404.
+    If a requests.Session() is given, its connection pool gets used.
+    If head_first is True, a HEAD request is tried first so that the
+    response body isn't downloaded. Only a 2xx or 3xx answer to HEAD is
+    trusted. (Some servers answer HEAD with errors such as 400, 403, 405,
+    or 500, which could hide a 404.) A GET request is used for the rest.
     For a list of available status codes, see:
     https://en.wikipedia.org/wiki/List_of_HTTP_status_codes
     """
     status_code = None
+    if not session:
+        session = requests
+    if head_first:
+        try:
+            response = session.head(
+                link, allow_redirects=allow_redirects, timeout=timeout
+            )
+            if 200 <= response.status_code < 400:
+                return response.status_code
+        except Exception:
+            pass
     try:
-        response = requests.get(
-            link, allow_redirects=allow_redirects, timeout=timeout
+        response = session.get(
+            link,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+            stream=True,
         )
         status_code = response.status_code
+        response.close()
     except Exception:
         status_code = 404
     return status_code
 
 
-def _print_unique_links_with_status_codes(page_url, soup):
-    """Finds all unique links in the html of the page source
-    and then prints out those links with their status codes.
-    Format:  ["link"  ->  "status_code"]  (per line)
-    Page links include those obtained from:
-    "a"->"href", "img"->"src", "link"->"href", and "script"->"src".
-    """
-    links = _get_unique_links(page_url, soup)
-    for link in links:
-        status_code = _get_link_status_code(link)
-        print(link, " -> ", status_code)
-
-
 def _download_file_to(file_url, destination_folder, new_file_name=None):
     if new_file_name:
         file_name = new_file_name
     else:
         file_name = file_url.split("/")[-1]
-    r = requests.get(file_url)
-    with open(destination_folder + "/" + file_name, "wb") as code:
-        code.write(r.content)
+    # (Closing the response puts the connection back in the shared pool)
+    with _get_requests_session().get(file_url, stream=True) as r:
+        with open(destination_folder + "/" + file_name, "wb") as code:
+            for chunk in r.iter_content(chunk_size=65536):
+                code.write(chunk)
 
 
 def _save_data_as(data, destination_folder, file_name):
@@ -259,6 +330,7 @@ def _save_data_as(data, destination_folder, file_name):
     out_file.close()
 
 
+@decorators.memoize()
 def make_css_match_first_element_only(selector):
     # Only get the first match
     last_syllable = selector.split(" ")[-1]
@@ -12,6 +12,9 @@ from seleniumbase.common.exceptions import NoSuchFileException
 from seleniumbase.common.exceptions import TimeLimitExceededException
 from seleniumbase import config as sb_config
 
+# Python 2.7 doesn't have a monotonic clock, so use time.time() there
+monotonic = getattr(time, "monotonic", time.time)
+
 
 def format_exc(exception, message):
     """
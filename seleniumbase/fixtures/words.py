@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """ Small Dictionary """
+from seleniumbase.common import decorators
 
 
 class SD:
+    @decorators.memoize()
     def translate_in(language):
         words = {}
         words["English"] = "in"
@@ -17,6 +19,7 @@ class SD:
         words["Spanish"] = "en"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert(language):
         words = {}
         words["English"] = "ASSERT"
@@ -31,6 +34,7 @@ class SD:
         words["Spanish"] = "VERIFICAR"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert_text(language):
         words = {}
         words["English"] = "ASSERT TEXT"
@@ -45,6 +49,7 @@ class SD:
         words["Spanish"] = "VERIFICAR TEXTO"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert_exact_text(language):
         words = {}
         words["English"] = "ASSERT EXACT TEXT"
@@ -59,6 +64,7 @@ class SD:
         words["Spanish"] = "VERIFICAR TEXTO EXACTO"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert_link_text(language):
         words = {}
         words["English"] = "ASSERT LINK TEXT"
@@ -73,6 +79,7 @@ class SD:
         words["Spanish"] = "VERIFICAR TEXTO DEL ENLACE"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert_attribute(language):
         words = {}
         words["English"] = "ASSERT ATTRIBUTE"
@@ -87,6 +94,7 @@ class SD:
         words["Spanish"] = "VERIFICAR ATRIBUTO"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert_title(language):
         words = {}
         words["English"] = "ASSERT TITLE"
@@ -101,6 +109,7 @@ class SD:
         words["Spanish"] = "VERIFICAR TÍTULO"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert_no_404_errors(language):
         words = {}
         words["English"] = "ASSERT NO 404 ERRORS"
@@ -115,6 +124,7 @@ class SD:
         words["Spanish"] = "VERIFICAR SI HAY ENLACES ROTOS"
         return words[language]
 
+    @decorators.memoize()
     def translate_assert_no_js_errors(language):
         words = {}
         words["English"] = "ASSERT NO JS ERRORS"
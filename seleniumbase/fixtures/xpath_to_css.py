@@ -2,6 +2,7 @@
 Convert XPath selectors into CSS selectors
 """
 import re
+from seleniumbase.common import decorators
 
 _sub_regexes = {
     "tag": r"([a-zA-Z][a-zA-Z0-9]{0,10}|\*)",
@@ -29,6 +30,20 @@ _validation_re = (
 
 prog = re.compile(_validation_re)
 
+# Special cases that get converted without the full parser:
+# //tag[@attribute='value' and (contains(., 'TEXT'))]
+_attr_and_contains_re = re.compile(
+    r"""^\s*//(\S+)\[@(\S+)='(\S+)'\s+and\s+"""
+    r"""\(contains\(\.,\s'(\S+)'\)\)\]"""
+)
+# //tag[@attribute1='value1' and (@attribute2='value2')]
+_two_attrs_re = re.compile(
+    r"""^\s*//(\S+)\[@(\S+)='(\S+)'\s+and\s+"""
+    r"""\(@(\S+)='(\S+)'\)\]"""
+)
+# [attribute=value] definitions in the converted CSS that may need quotes
+_attribute_def_re = re.compile(r"(\[\w+\=\S+\])")
+
 
 class XpathException(Exception):
     pass
@@ -134,6 +149,7 @@ def _get_raw_css_from_xpath(xpath):
         return css
 
 
+@decorators.memoize()
 def convert_xpath_to_css(xpath):
     xpath = xpath.replace(" = '", "='")
 
@@ -155,11 +171,7 @@ def convert_xpath_to_css(xpath):
             return '%s.%s:contains("%s")' % (s_tag, s_class, s_contains)
 
     # Find instance of: //tag[@attribute='value' and (contains(., 'TEXT'))]
-    data = re.match(
-        r"""^\s*//(\S+)\[@(\S+)='(\S+)'\s+and\s+"""
-        r"""\(contains\(\.,\s'(\S+)'\)\)\]""",
-        xpath,
-    )
+    data = _attr_and_contains_re.match(xpath)
     if data:
         s_tag = data.group(1)
         s_atr = data.group(2)
@@ -168,11 +180,7 @@ def convert_xpath_to_css(xpath):
         return '%s[%s="%s"]:contains("%s")' % (s_tag, s_atr, s_val, s_contains)
 
     # Find instance of: //tag[@attribute1='value1' and (@attribute2='value2')]
-    data = re.match(
-        r"""^\s*//(\S+)\[@(\S+)='(\S+)'\s+and\s+"""
-        r"""\(@(\S+)='(\S+)'\)\]""",
-        xpath,
-    )
+    data = _two_attrs_re.match(xpath)
     if data:
         s_tag = data.group(1)
         s_atr1 = data.group(2)
@@ -208,7 +216,7 @@ def convert_xpath_to_css(xpath):
 
     css = _get_raw_css_from_xpath(xpath)
 
-    attribute_defs = re.findall(r"(\[\w+\=\S+\])", css)
+    attribute_defs = _attribute_def_re.findall(css)
     for attr_def in attribute_defs:
         if (
             attr_def.count("[") == 1
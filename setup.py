@@ -182,6 +182,8 @@ setup(
         'soupsieve==2.2.1;python_version>="3.6"',
         'beautifulsoup4==4.9.3;python_version<"3.5"',
         'beautifulsoup4==4.10.0;python_version>="3.5"',
+        'lxml==4.6.3;python_version<"3.10"',
+        'lxml>=4.6.3;python_version>="3.10"',
         'cryptography==2.9.2;python_version<"3.5"',
         'cryptography==3.2.1;python_version>="3.5" and python_version<"3.6"',
         'cryptography==3.4.8;python_version>="3.6"',